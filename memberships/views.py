@@ -79,7 +79,7 @@ class SubscriptionDetailView(LoginRequiredMixin, DetailView):
     
     def get_queryset(self):
         # Users can only view their own subscriptions unless they're staff
-        if self.request.user.is_staff_or_above():
+        if self.request.user.is_staff_or_above:
             return Subscription.objects.all()
         return Subscription.objects.filter(user=self.request.user)
     
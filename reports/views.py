@@ -2,10 +2,10 @@ from django.shortcuts import render
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import TemplateView
 from django.http import HttpResponse, JsonResponse
-from django.db.models import Sum, Count, Q, Avg
+from django.db.models import Sum, Count, Q, Avg, F, OuterRef, Subquery, DurationField
 from django.utils import timezone
 from django.db.models.functions import TruncMonth, TruncDate, Extract
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 import csv
 from io import BytesIO
@@ -19,6 +19,162 @@ from users.models import User, Attendance, TrainingSession, TrainerTraineeAssign
 from memberships.models import Payment, Subscription
 
 
+def _add_months(day, months):
+    """Return the first day of the month ``months`` away from ``day``."""
+    year, month = divmod(day.year * 12 + day.month - 1 + months, 12)
+    return date(year, month + 1, 1)
+
+
+def _monthly_retention_data():
+    """
+    Build the 13-month retention trend from a single subscription fetch.
+
+    All month buckets are counted in Python over one ``values_list`` scan
+    instead of issuing five COUNT queries per month.
+    """
+    rows = list(Subscription.objects.values_list(
+        'start_date', 'end_date', 'status', 'created_at', 'updated_at'
+    ))
+
+    monthly_data = []
+    current_date = timezone.now().date()
+    for i in range(12, -1, -1):  # Last 12 months
+        month_start = _add_months(current_date, -i)
+        month_end = _add_months(month_start, 1)
+
+        start_edge = timezone.make_aware(datetime.combine(month_start, datetime.min.time()))
+        end_edge = timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
+
+        active_at_start = 0
+        new_in_month = 0
+        expired_in_month = 0
+        cancelled_in_month = 0
+        active_at_end = 0
+        for start_date, end_date, status, created_at, updated_at in rows:
+            if start_edge <= created_at < end_edge:
+                new_in_month += 1
+            if status == Subscription.Status.ACTIVE:
+                if start_date < start_edge <= end_date:
+                    active_at_start += 1
+                if start_date < end_edge <= end_date:
+                    active_at_end += 1
+            elif status == Subscription.Status.EXPIRED:
+                if start_edge <= end_date < end_edge:
+                    expired_in_month += 1
+            elif status == Subscription.Status.CANCELLED:
+                if start_edge <= updated_at < end_edge:
+                    cancelled_in_month += 1
+
+        monthly_retention = 0
+        if active_at_start > 0:
+            monthly_retention = ((active_at_start - expired_in_month - cancelled_in_month + new_in_month) / active_at_start) * 100
+
+        monthly_data.append({
+            'month': month_start.strftime('%Y-%m'),
+            'month_name': month_start.strftime('%B %Y'),
+            'active_at_start': active_at_start,
+            'new_subscriptions': new_in_month,
+            'expired': expired_in_month,
+            'cancelled': cancelled_in_month,
+            'active_at_end': active_at_end,
+            'retention_rate': round(monthly_retention, 2),
+        })
+
+    return monthly_data
+
+
+def _retention_summary():
+    """
+    Headline retention metrics plus the monthly trend.
+
+    A fresh install with no subscriptions short-circuits to an all-zero
+    report after a single ``EXISTS`` probe.
+    """
+    total_members = User.objects.filter(role=User.Role.TRAINEE).count()
+
+    if not Subscription.objects.exists():
+        return {
+            'total_members': total_members,
+            'total_ever_subscribed': 0,
+            'active_subscriptions': 0,
+            'expired_subscriptions': 0,
+            'cancelled_subscriptions': 0,
+            'retention_rate': 0,
+            'churn_rate': 0,
+            'monthly_data': [],
+        }
+
+    active_subscriptions = Subscription.objects.filter(status=Subscription.Status.ACTIVE).count()
+    expired_subscriptions = Subscription.objects.filter(status=Subscription.Status.EXPIRED).count()
+    cancelled_subscriptions = Subscription.objects.filter(status=Subscription.Status.CANCELLED).count()
+
+    # Calculate retention rate (active / total ever subscribed)
+    total_ever_subscribed = Subscription.objects.values('user').distinct().count()
+    retention_rate = 0
+    if total_ever_subscribed > 0:
+        retention_rate = (active_subscriptions / total_ever_subscribed) * 100
+
+    # Churn rate
+    total_churned = expired_subscriptions + cancelled_subscriptions
+    churn_rate = 0
+    if total_ever_subscribed > 0:
+        churn_rate = (total_churned / total_ever_subscribed) * 100
+
+    return {
+        'total_members': total_members,
+        'total_ever_subscribed': total_ever_subscribed,
+        'active_subscriptions': active_subscriptions,
+        'expired_subscriptions': expired_subscriptions,
+        'cancelled_subscriptions': cancelled_subscriptions,
+        'retention_rate': round(retention_rate, 2),
+        'churn_rate': round(churn_rate, 2),
+        'monthly_data': _monthly_retention_data(),
+    }
+
+
+def _trainer_utilization_queryset(start_date, end_date):
+    """
+    Trainers annotated with their utilization figures for the given period.
+
+    Every per-trainer count is computed in one SQL statement; completed
+    session time is summed in a correlated subquery so the session join
+    does not inflate it.
+    """
+    in_period = Q(
+        training_sessions__session_date__gte=start_date,
+        training_sessions__session_date__lte=end_date,
+    )
+    completed_time = TrainingSession.objects.filter(
+        trainer=OuterRef('pk'),
+        session_date__gte=start_date,
+        session_date__lte=end_date,
+        status=TrainingSession.Status.COMPLETED,
+    ).values('trainer').annotate(
+        total=Sum(F('end_time') - F('start_time'))
+    ).values('total')
+
+    return User.objects.filter(role=User.Role.TRAINER).annotate(
+        active_assignments=Count(
+            'assigned_trainees', filter=Q(assigned_trainees__is_active=True), distinct=True
+        ),
+        session_count=Count('training_sessions', filter=in_period, distinct=True),
+        completed_count=Count(
+            'training_sessions',
+            filter=in_period & Q(training_sessions__status=TrainingSession.Status.COMPLETED),
+            distinct=True,
+        ),
+        cancelled_count=Count(
+            'training_sessions',
+            filter=in_period & Q(training_sessions__status=TrainingSession.Status.CANCELLED),
+            distinct=True,
+        ),
+        completed_time=Subquery(completed_time, output_field=DurationField()),
+        availability_slots=Count(
+            'availabilities', filter=Q(availabilities__is_available=True), distinct=True
+        ),
+    ).order_by('-date_joined')
+
+
 class ReportsDashboardView(StaffOrAboveRequiredMixin, TemplateView):
     """Main reports dashboard"""
     template_name = 'reports/dashboard.html'
@@ -418,7 +574,7 @@ class AttendanceHeatmapCSVView(StaffOrAboveRequiredMixin, TemplateView):
                 attendance.trainee.get_full_name() or attendance.trainee.username,
                 attendance.check_in.strftime('%Y-%m-%d %H:%M:%S'),
                 attendance.check_out.strftime('%Y-%m-%d %H:%M:%S') if attendance.check_out else 'N/A',
-                attendance.duration if attendance.duration else 'N/A'
+                attendance.duration_minutes if attendance.duration_minutes else 'N/A'
             ])
         
         writer.writerow([])
@@ -690,7 +846,10 @@ class TrainerUtilizationPDFView(StaffOrAboveRequiredMixin, TemplateView):
             end_date = timezone.now().date()
             start_date = end_date - timedelta(days=30)
         
-        trainers = User.objects.filter(role=User.Role.TRAINER)
+        rows = _trainer_utilization_queryset(start_date, end_date).values(
+            'username', 'first_name', 'last_name', 'active_assignments', 'session_count',
+            'completed_count', 'cancelled_count', 'completed_time', 'availability_slots',
+        )
         
         # Create PDF
         buffer = BytesIO()
@@ -714,40 +873,18 @@ class TrainerUtilizationPDFView(StaffOrAboveRequiredMixin, TemplateView):
         # Trainer stats table
         table_data = [['Trainer', 'Active Assignments', 'Total Sessions', 'Completed', 'Cancelled', 'Total Hours', 'Utilization %']]
         
-        for trainer in trainers:
-            active_assignments = TrainerTraineeAssignment.objects.filter(
-                trainer=trainer,
-                is_active=True
-            ).count()
-            
-            sessions = TrainingSession.objects.filter(
-                trainer=trainer,
-                session_date__gte=start_date,
-                session_date__lte=end_date
-            )
-            
-            total_sessions = sessions.count()
-            completed_sessions = sessions.filter(status=TrainingSession.Status.COMPLETED).count()
-            cancelled_sessions = sessions.filter(status=TrainingSession.Status.CANCELLED).count()
-            
-            total_hours = 0
-            for session in sessions.filter(status=TrainingSession.Status.COMPLETED):
-                total_hours += session.duration_minutes / 60
-            
-            availability_slots = trainer.availabilities.filter(is_available=True).count()
-            utilization_rate = 0
-            if availability_slots > 0:
-                utilization_rate = min((total_sessions / (availability_slots * 4)) * 100, 100)
-            
-            table_data.append([
-                trainer.get_full_name() or trainer.username,
-                str(active_assignments),
-                str(total_sessions),
-                str(completed_sessions),
-                str(cancelled_sessions),
-                f'{total_hours:.2f}',
-                f'{utilization_rate:.2f}%'
-            ])
+        table_data += [
+            [
+                f"{r['first_name']} {r['last_name']}".strip() or r['username'],
+                str(r['active_assignments']),
+                str(r['session_count']),
+                str(r['completed_count']),
+                str(r['cancelled_count']),
+                f"{r['completed_time'].total_seconds() / 3600 if r['completed_time'] else 0:.2f}",
+                f"{min((r['session_count'] / (r['availability_slots'] * 4)) * 100, 100) if r['availability_slots'] else 0:.2f}%",
+            ]
+            for r in rows
+        ]
         
         table = Table(table_data, colWidths=[1.5*inch, 1*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch])
         table.setStyle(TableStyle([
@@ -782,96 +919,7 @@ class MemberRetentionView(StaffOrAboveRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Get all subscriptions
-        all_subscriptions = Subscription.objects.all().order_by('created_at')
-        
-        # Calculate retention metrics
-        total_members = User.objects.filter(role=User.Role.TRAINEE).count()
-        active_subscriptions = Subscription.objects.filter(status=Subscription.Status.ACTIVE).count()
-        expired_subscriptions = Subscription.objects.filter(status=Subscription.Status.EXPIRED).count()
-        cancelled_subscriptions = Subscription.objects.filter(status=Subscription.Status.CANCELLED).count()
-        
-        # Calculate retention rate (active / total ever subscribed)
-        total_ever_subscribed = all_subscriptions.values('user').distinct().count()
-        retention_rate = 0
-        if total_ever_subscribed > 0:
-            retention_rate = (active_subscriptions / total_ever_subscribed) * 100
-        
-        # Monthly retention trend
-        monthly_data = []
-        current_date = timezone.now().date()
-        for i in range(12, -1, -1):  # Last 12 months
-            month_start = (current_date.replace(day=1) - timedelta(days=30*i)).replace(day=1)
-            if month_start.month == 12:
-                month_end = month_start.replace(year=month_start.year + 1, month=1)
-            else:
-                month_end = month_start.replace(month=month_start.month + 1)
-            
-            # Active at start of month
-            active_at_start = Subscription.objects.filter(
-                status=Subscription.Status.ACTIVE,
-                start_date__lt=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                end_date__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time()))
-            ).count()
-            
-            # New subscriptions in month
-            new_in_month = Subscription.objects.filter(
-                created_at__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                created_at__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            # Expired in month
-            expired_in_month = Subscription.objects.filter(
-                status=Subscription.Status.EXPIRED,
-                end_date__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                end_date__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            # Cancelled in month
-            cancelled_in_month = Subscription.objects.filter(
-                status=Subscription.Status.CANCELLED,
-                updated_at__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                updated_at__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            # Active at end of month
-            active_at_end = Subscription.objects.filter(
-                status=Subscription.Status.ACTIVE,
-                start_date__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time())),
-                end_date__gte=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            monthly_retention = 0
-            if active_at_start > 0:
-                monthly_retention = ((active_at_start - expired_in_month - cancelled_in_month + new_in_month) / active_at_start) * 100
-            
-            monthly_data.append({
-                'month': month_start.strftime('%Y-%m'),
-                'month_name': month_start.strftime('%B %Y'),
-                'active_at_start': active_at_start,
-                'new_subscriptions': new_in_month,
-                'expired': expired_in_month,
-                'cancelled': cancelled_in_month,
-                'active_at_end': active_at_end,
-                'retention_rate': round(monthly_retention, 2),
-            })
-        
-        # Churn rate
-        total_churned = expired_subscriptions + cancelled_subscriptions
-        churn_rate = 0
-        if total_ever_subscribed > 0:
-            churn_rate = (total_churned / total_ever_subscribed) * 100
-        
-        context.update({
-            'total_members': total_members,
-            'total_ever_subscribed': total_ever_subscribed,
-            'active_subscriptions': active_subscriptions,
-            'expired_subscriptions': expired_subscriptions,
-            'cancelled_subscriptions': cancelled_subscriptions,
-            'retention_rate': round(retention_rate, 2),
-            'churn_rate': round(churn_rate, 2),
-            'monthly_data': monthly_data,
-        })
+        context.update(_retention_summary())
         
         return context
 
@@ -880,21 +928,7 @@ class MemberRetentionCSVView(StaffOrAboveRequiredMixin, TemplateView):
     """Export member retention as CSV"""
     
     def get(self, request, *args, **kwargs):
-        all_subscriptions = Subscription.objects.all().order_by('created_at')
-        total_members = User.objects.filter(role=User.Role.TRAINEE).count()
-        active_subscriptions = Subscription.objects.filter(status=Subscription.Status.ACTIVE).count()
-        expired_subscriptions = Subscription.objects.filter(status=Subscription.Status.EXPIRED).count()
-        cancelled_subscriptions = Subscription.objects.filter(status=Subscription.Status.CANCELLED).count()
-        total_ever_subscribed = all_subscriptions.values('user').distinct().count()
-        
-        retention_rate = 0
-        if total_ever_subscribed > 0:
-            retention_rate = (active_subscriptions / total_ever_subscribed) * 100
-        
-        total_churned = expired_subscriptions + cancelled_subscriptions
-        churn_rate = 0
-        if total_ever_subscribed > 0:
-            churn_rate = (total_churned / total_ever_subscribed) * 100
+        summary = _retention_summary()
         
         response = HttpResponse(content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="member_retention_report.csv"'
@@ -903,66 +937,26 @@ class MemberRetentionCSVView(StaffOrAboveRequiredMixin, TemplateView):
         writer.writerow(['Member Retention Report'])
         writer.writerow([])
         writer.writerow(['Metric', 'Value'])
-        writer.writerow(['Total Members', total_members])
-        writer.writerow(['Total Ever Subscribed', total_ever_subscribed])
-        writer.writerow(['Active Subscriptions', active_subscriptions])
-        writer.writerow(['Expired Subscriptions', expired_subscriptions])
-        writer.writerow(['Cancelled Subscriptions', cancelled_subscriptions])
-        writer.writerow(['Retention Rate %', f'{retention_rate:.2f}'])
-        writer.writerow(['Churn Rate %', f'{churn_rate:.2f}'])
+        writer.writerow(['Total Members', summary['total_members']])
+        writer.writerow(['Total Ever Subscribed', summary['total_ever_subscribed']])
+        writer.writerow(['Active Subscriptions', summary['active_subscriptions']])
+        writer.writerow(['Expired Subscriptions', summary['expired_subscriptions']])
+        writer.writerow(['Cancelled Subscriptions', summary['cancelled_subscriptions']])
+        writer.writerow(['Retention Rate %', f"{summary['retention_rate']:.2f}"])
+        writer.writerow(['Churn Rate %', f"{summary['churn_rate']:.2f}"])
         writer.writerow([])
         writer.writerow(['Monthly Retention Data'])
         writer.writerow(['Month', 'Active at Start', 'New Subscriptions', 'Expired', 'Cancelled', 'Active at End', 'Retention Rate %'])
         
-        current_date = timezone.now().date()
-        for i in range(12, -1, -1):
-            month_start = (current_date.replace(day=1) - timedelta(days=30*i)).replace(day=1)
-            if month_start.month == 12:
-                month_end = month_start.replace(year=month_start.year + 1, month=1)
-            else:
-                month_end = month_start.replace(month=month_start.month + 1)
-            
-            active_at_start = Subscription.objects.filter(
-                status=Subscription.Status.ACTIVE,
-                start_date__lt=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                end_date__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time()))
-            ).count()
-            
-            new_in_month = Subscription.objects.filter(
-                created_at__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                created_at__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            expired_in_month = Subscription.objects.filter(
-                status=Subscription.Status.EXPIRED,
-                end_date__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                end_date__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            cancelled_in_month = Subscription.objects.filter(
-                status=Subscription.Status.CANCELLED,
-                updated_at__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                updated_at__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            active_at_end = Subscription.objects.filter(
-                status=Subscription.Status.ACTIVE,
-                start_date__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time())),
-                end_date__gte=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            monthly_retention = 0
-            if active_at_start > 0:
-                monthly_retention = ((active_at_start - expired_in_month - cancelled_in_month + new_in_month) / active_at_start) * 100
-            
+        for month in summary['monthly_data']:
             writer.writerow([
-                month_start.strftime('%Y-%m'),
-                active_at_start,
-                new_in_month,
-                expired_in_month,
-                cancelled_in_month,
-                active_at_end,
-                f'{monthly_retention:.2f}'
+                month['month'],
+                month['active_at_start'],
+                month['new_subscriptions'],
+                month['expired'],
+                month['cancelled'],
+                month['active_at_end'],
+                f"{month['retention_rate']:.2f}"
             ])
         
         return response
@@ -972,21 +966,7 @@ class MemberRetentionPDFView(StaffOrAboveRequiredMixin, TemplateView):
     """Export member retention as PDF"""
     
     def get(self, request, *args, **kwargs):
-        all_subscriptions = Subscription.objects.all().order_by('created_at')
-        total_members = User.objects.filter(role=User.Role.TRAINEE).count()
-        active_subscriptions = Subscription.objects.filter(status=Subscription.Status.ACTIVE).count()
-        expired_subscriptions = Subscription.objects.filter(status=Subscription.Status.EXPIRED).count()
-        cancelled_subscriptions = Subscription.objects.filter(status=Subscription.Status.CANCELLED).count()
-        total_ever_subscribed = all_subscriptions.values('user').distinct().count()
-        
-        retention_rate = 0
-        if total_ever_subscribed > 0:
-            retention_rate = (active_subscriptions / total_ever_subscribed) * 100
-        
-        total_churned = expired_subscriptions + cancelled_subscriptions
-        churn_rate = 0
-        if total_ever_subscribed > 0:
-            churn_rate = (total_churned / total_ever_subscribed) * 100
+        summary = _retention_summary()
         
         # Create PDF
         buffer = BytesIO()
@@ -1008,13 +988,13 @@ class MemberRetentionPDFView(StaffOrAboveRequiredMixin, TemplateView):
         
         # Summary
         summary_data = [
-            ['Total Members', str(total_members)],
-            ['Total Ever Subscribed', str(total_ever_subscribed)],
-            ['Active Subscriptions', str(active_subscriptions)],
-            ['Expired Subscriptions', str(expired_subscriptions)],
-            ['Cancelled Subscriptions', str(cancelled_subscriptions)],
-            ['Retention Rate', f'{retention_rate:.2f}%'],
-            ['Churn Rate', f'{churn_rate:.2f}%'],
+            ['Total Members', str(summary['total_members'])],
+            ['Total Ever Subscribed', str(summary['total_ever_subscribed'])],
+            ['Active Subscriptions', str(summary['active_subscriptions'])],
+            ['Expired Subscriptions', str(summary['expired_subscriptions'])],
+            ['Cancelled Subscriptions', str(summary['cancelled_subscriptions'])],
+            ['Retention Rate', f"{summary['retention_rate']:.2f}%"],
+            ['Churn Rate', f"{summary['churn_rate']:.2f}%"],
         ]
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
         summary_table.setStyle(TableStyle([
@@ -1035,55 +1015,15 @@ class MemberRetentionPDFView(StaffOrAboveRequiredMixin, TemplateView):
         
         table_data = [['Month', 'Active Start', 'New', 'Expired', 'Cancelled', 'Active End', 'Retention %']]
         
-        current_date = timezone.now().date()
-        for i in range(12, -1, -1):
-            month_start = (current_date.replace(day=1) - timedelta(days=30*i)).replace(day=1)
-            if month_start.month == 12:
-                month_end = month_start.replace(year=month_start.year + 1, month=1)
-            else:
-                month_end = month_start.replace(month=month_start.month + 1)
-            
-            active_at_start = Subscription.objects.filter(
-                status=Subscription.Status.ACTIVE,
-                start_date__lt=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                end_date__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time()))
-            ).count()
-            
-            new_in_month = Subscription.objects.filter(
-                created_at__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                created_at__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            expired_in_month = Subscription.objects.filter(
-                status=Subscription.Status.EXPIRED,
-                end_date__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                end_date__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            cancelled_in_month = Subscription.objects.filter(
-                status=Subscription.Status.CANCELLED,
-                updated_at__gte=timezone.make_aware(datetime.combine(month_start, datetime.min.time())),
-                updated_at__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            active_at_end = Subscription.objects.filter(
-                status=Subscription.Status.ACTIVE,
-                start_date__lt=timezone.make_aware(datetime.combine(month_end, datetime.min.time())),
-                end_date__gte=timezone.make_aware(datetime.combine(month_end, datetime.min.time()))
-            ).count()
-            
-            monthly_retention = 0
-            if active_at_start > 0:
-                monthly_retention = ((active_at_start - expired_in_month - cancelled_in_month + new_in_month) / active_at_start) * 100
-            
+        for month in summary['monthly_data']:
             table_data.append([
-                month_start.strftime('%Y-%m'),
-                str(active_at_start),
-                str(new_in_month),
-                str(expired_in_month),
-                str(cancelled_in_month),
-                str(active_at_end),
-                f'{monthly_retention:.2f}%'
+                month['month'],
+                str(month['active_at_start']),
+                str(month['new_subscriptions']),
+                str(month['expired']),
+                str(month['cancelled']),
+                str(month['active_at_end']),
+                f"{month['retention_rate']:.2f}%"
             ])
         
         table = Table(table_data, colWidths=[1*inch, 0.8*inch, 0.6*inch, 0.6*inch, 0.6*inch, 0.8*inch, 0.8*inch])
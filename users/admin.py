@@ -80,13 +80,7 @@ class AttendanceAdmin(admin.ModelAdmin):
     
     def duration_display(self, obj):
         """Display duration in a readable format"""
-        if obj.duration:
-            hours = obj.duration // 60
-            minutes = obj.duration % 60
-            if hours > 0:
-                return f"{hours}h {minutes}m"
-            return f"{minutes}m"
-        return "—"
+        return obj.get_duration_display()
     duration_display.short_description = "Duration"
     
     def is_checked_in_display(self, obj):
@@ -1,146 +1,180 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, PasswordChangeForm
+from django.core.exceptions import ValidationError
+from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
-from datetime import datetime, timedelta, time
+from datetime import timedelta, time
+from copy import deepcopy
+from functools import lru_cache
 from .models import User, TrainerTraineeAssignment, TrainerAvailability, TrainingSession, SessionReminder
 
 
-class UserForm(UserCreationForm):
-    """Form for creating and updating users."""
-    
-    first_name = forms.CharField(
+# Component classes defined in static/src/input.css
+INPUT_CLASS = 'gb-input'
+SELECT_ATTRS = {'class': INPUT_CLASS}
+CHECKBOX_ATTRS = {'class': 'gb-checkbox'}
+
+# Compiled once and shared by every form that takes a phone number
+PHONE_VALIDATOR = RegexValidator(
+    r'^[0-9+()\-\s]*$',
+    'Phone number may only contain digits, spaces, +, - and parentheses.'
+)
+
+
+def _text_attrs(placeholder):
+    """Widget attrs for a standard text-style input with a placeholder."""
+    return {'class': INPUT_CLASS, 'placeholder': placeholder}
+
+
+class CachedModelChoiceIterator(forms.models.ModelChoiceIterator):
+    """Iterate the field's queryset itself so its results are cached for reuse."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.queryset:
+            yield self.choice(obj)
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField that evaluates its queryset at most once per form.
+
+    Rendering reuses the evaluated queryset, and validation looks the
+    submitted value up in it when it has already been loaded.
+    """
+    iterator = CachedModelChoiceIterator
+
+    def to_python(self, value):
+        if value in self.empty_values or self.queryset._result_cache is None:
+            return super().to_python(value)
+        key = self.to_field_name or 'pk'
+        if isinstance(value, self.queryset.model):
+            value = getattr(value, key)
+        for obj in self.queryset:
+            if str(getattr(obj, key)) == str(value):
+                return obj
+        raise ValidationError(
+            self.error_messages['invalid_choice'],
+            code='invalid_choice',
+            params={'value': value},
+        )
+
+
+class _SharedFieldMixin:
+    """
+    Field that is never mutated per form instance, so every form shares the
+    declared instance instead of BaseForm deep-copying it on each init.
+    """
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class SharedCharField(_SharedFieldMixin, forms.CharField):
+    pass
+
+
+class SharedEmailField(_SharedFieldMixin, forms.EmailField):
+    pass
+
+
+class SharedBooleanField(_SharedFieldMixin, forms.BooleanField):
+    pass
+
+
+# Columns needed to render a user as a dropdown option
+_USER_LABEL_FIELDS = ('id', 'display_name')
+
+
+class UserChoiceField(CachedModelChoiceField):
+    """Cached user dropdown labelled by full name, falling back to username."""
+
+    def label_from_instance(self, obj):
+        return obj.display_name
+
+
+# Role choices a user may assign, computed once at import
+_ALL_ROLE_CHOICES = tuple(User.Role.choices)
+_ROLE_LABELS = dict(_ALL_ROLE_CHOICES)
+_OWNER_ROLE_CHOICES = tuple(
+    choice for choice in _ALL_ROLE_CHOICES
+    if choice[0] != User.Role.SUPER_ADMIN
+)
+_MANAGER_ROLE_CHOICES = ((User.Role.TRAINEE.value, _ROLE_LABELS[User.Role.TRAINEE]),)
+_ROLE_CHOICES_BY_TIER = {
+    # Super admin can create all roles
+    User.Role.SUPER_ADMIN: _ALL_ROLE_CHOICES,
+    # Owner can create all roles except Super Admin
+    User.Role.OWNER: _OWNER_ROLE_CHOICES,
+    # Manager can only create Trainees
+    User.Role.MANAGER: _MANAGER_ROLE_CHOICES,
+}
+
+# Model choice tables, likewise built once. Fields take them through a
+# callable so form instances don't deep-copy the choice lists.
+_DAY_OF_WEEK_CHOICES = tuple(TrainerAvailability.DayOfWeek.choices)
+_SESSION_STATUS_CHOICES = tuple(TrainingSession.Status.choices)
+_REMINDER_TYPE_CHOICES = tuple(SessionReminder.ReminderType.choices)
+
+
+class _CommonUserFieldsMixin(forms.Form):
+    """Fields shared by the user management and profile forms."""
+
+    first_name = SharedCharField(
         max_length=150,
         required=True,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'First Name'
-        })
+        widget=forms.TextInput(attrs=_text_attrs('First Name'))
     )
-    last_name = forms.CharField(
+    last_name = SharedCharField(
         max_length=150,
         required=True,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Last Name'
-        })
+        widget=forms.TextInput(attrs=_text_attrs('Last Name'))
     )
-    email = forms.EmailField(
+    email = SharedEmailField(
         required=True,
-        widget=forms.EmailInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Email Address'
-        })
+        widget=forms.EmailInput(attrs=_text_attrs('Email Address'))
     )
-    phone_number = forms.CharField(
+    phone_number = SharedCharField(
         max_length=20,
         required=False,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Phone Number (Optional)'
-        })
+        validators=[PHONE_VALIDATOR],
+        widget=forms.TextInput(attrs=_text_attrs('Phone Number (Optional)'))
     )
     role = forms.ChoiceField(
-        choices=User.Role.choices,
+        choices=lambda: _ALL_ROLE_CHOICES,
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        })
+        widget=forms.Select(attrs=SELECT_ATTRS)
     )
-    is_active = forms.BooleanField(
+
+
+class UserForm(_CommonUserFieldsMixin, UserCreationForm):
+    """Form for creating and updating users."""
+    
+    is_active = SharedBooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'w-4 h-4 text-emerald-600 border-slate-300 rounded focus:ring-emerald-500'
-        })
+        widget=forms.CheckboxInput(attrs=CHECKBOX_ATTRS)
     )
 
     class Meta:
         model = User
         fields = ('username', 'first_name', 'last_name', 'email', 'phone_number', 'role', 'password1', 'password2', 'is_active')
         widgets = {
-            'username': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-                'placeholder': 'Username'
-            }),
-            'password1': forms.PasswordInput(attrs={
-                'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-                'placeholder': 'Password'
-            }),
-            'password2': forms.PasswordInput(attrs={
-                'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-                'placeholder': 'Confirm Password'
-            }),
+            'username': forms.TextInput(attrs=_text_attrs('Username')),
+            'password1': forms.PasswordInput(attrs=_text_attrs('Password')),
+            'password2': forms.PasswordInput(attrs=_text_attrs('Confirm Password')),
         }
 
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        
-        # Limit role choices based on user permissions
-        if user:
-            if user.is_super_admin():
-                # Super admin can create all roles
-                pass
-            elif user.is_owner():
-                # Owner can create all roles except Super Admin
-                self.fields['role'].choices = [
-                    choice for choice in User.Role.choices 
-                    if choice[0] != User.Role.SUPER_ADMIN
-                ]
-            elif user.is_manager():
-                # Manager can only create Trainees
-                self.fields['role'].choices = [
-                    (User.Role.TRAINEE, User.Role.TRAINEE.label)
-                ]
-
-
-class UserUpdateForm(forms.ModelForm):
+
+class UserUpdateForm(_CommonUserFieldsMixin, forms.ModelForm):
     """Form for updating existing users (without password)."""
     
-    first_name = forms.CharField(
-        max_length=150,
-        required=True,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'First Name'
-        })
-    )
-    last_name = forms.CharField(
-        max_length=150,
-        required=True,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Last Name'
-        })
-    )
-    email = forms.EmailField(
-        required=True,
-        widget=forms.EmailInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Email Address'
-        })
-    )
-    phone_number = forms.CharField(
-        max_length=20,
+    is_active = SharedBooleanField(
         required=False,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Phone Number (Optional)'
-        })
-    )
-    role = forms.ChoiceField(
-        choices=User.Role.choices,
-        required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        })
-    )
-    is_active = forms.BooleanField(
-        required=False,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'w-4 h-4 text-emerald-600 border-slate-300 rounded focus:ring-emerald-500'
-        })
+        widget=forms.CheckboxInput(attrs=CHECKBOX_ATTRS)
     )
 
     class Meta:
@@ -148,69 +182,41 @@ class UserUpdateForm(forms.ModelForm):
         fields = ('username', 'first_name', 'last_name', 'email', 'phone_number', 'role', 'is_active')
         widgets = {
             'username': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-                'placeholder': 'Username',
+                **_text_attrs('Username'),
                 'readonly': True
             }),
         }
 
-    def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
-        super().__init__(*args, **kwargs)
-        
-        # Limit role choices based on user permissions
-        if user:
-            if user.is_super_admin():
-                pass
-            elif user.is_owner():
-                self.fields['role'].choices = [
-                    choice for choice in User.Role.choices 
-                    if choice[0] != User.Role.SUPER_ADMIN
-                ]
-            elif user.is_manager():
-                self.fields['role'].choices = [
-                    (User.Role.TRAINEE, User.Role.TRAINEE.label)
-                ]
-
-
-class ProfileForm(forms.ModelForm):
+
+def assignable_role_choices(tier):
+    """Return the (value, label) role choices a user of the given tier may assign."""
+    return _ROLE_CHOICES_BY_TIER.get(tier, ())
+
+
+@lru_cache(maxsize=None)
+def role_limited_form(form_class, tier):
+    """
+    Return a subclass of form_class whose role field only offers the roles
+    a user of the given tier may assign. Built once per (form, tier) pair.
+    """
+    choices = _ROLE_CHOICES_BY_TIER.get(tier)
+    if choices is None:
+        return form_class
+    role = deepcopy(form_class.base_fields['role'])
+    # A callable is resolved lazily and is not deep-copied per form instance
+    role.choices = lambda: choices
+    name = form_class.__name__ + User.Role(tier).label.replace(' ', '')
+    return type(name, (form_class,), {'role': role})
+
+
+class ProfileForm(_CommonUserFieldsMixin, forms.ModelForm):
     """Form for users to edit their own profile."""
     
-    first_name = forms.CharField(
-        max_length=150,
-        required=True,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'First Name'
-        })
-    )
-    last_name = forms.CharField(
-        max_length=150,
-        required=True,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Last Name'
-        })
-    )
-    email = forms.EmailField(
-        required=True,
-        widget=forms.EmailInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Email Address'
-        })
-    )
-    phone_number = forms.CharField(
-        max_length=20,
-        required=False,
-        widget=forms.TextInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Phone Number (Optional)'
-        })
-    )
+    role = None
     profile_picture = forms.ImageField(
         required=False,
         widget=forms.FileInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500 file:mr-4 file:py-2 file:px-4 file:rounded-lg file:border-0 file:text-sm file:font-semibold file:bg-emerald-50 file:text-emerald-700 hover:file:bg-emerald-100',
+            'class': f'{INPUT_CLASS} file:mr-4 file:py-2 file:px-4 file:rounded-lg file:border-0 file:text-sm file:font-semibold file:bg-emerald-50 file:text-emerald-700 hover:file:bg-emerald-100',
             'accept': 'image/*'
         })
     )
@@ -228,56 +234,47 @@ class ProfileForm(forms.ModelForm):
 
 class ProfilePasswordChangeForm(PasswordChangeForm):
     """Form for users to change their password."""
+
+    PLACEHOLDERS = (
+        ('old_password', 'Current Password'),
+        ('new_password1', 'New Password'),
+        ('new_password2', 'Confirm New Password'),
+    )
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['old_password'].widget.attrs.update({
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Current Password'
-        })
-        self.fields['new_password1'].widget.attrs.update({
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'New Password'
-        })
-        self.fields['new_password2'].widget.attrs.update({
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'placeholder': 'Confirm New Password'
-        })
+        for name, placeholder in self.PLACEHOLDERS:
+            self.fields[name].widget.attrs.update(_text_attrs(placeholder))
 
 
 class TrainerTraineeAssignmentForm(forms.ModelForm):
     """Form for creating and updating trainer-trainee assignments."""
     
-    trainer = forms.ModelChoiceField(
-        queryset=User.objects.filter(role=User.Role.TRAINER, is_active=True),
+    trainer = UserChoiceField(
+        queryset=User.objects.trainers().only(*_USER_LABEL_FIELDS),
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        }),
+        widget=forms.Select(attrs=SELECT_ATTRS),
         help_text="Select a trainer"
     )
-    trainee = forms.ModelChoiceField(
-        queryset=User.objects.filter(role=User.Role.TRAINEE, is_active=True),
+    trainee = UserChoiceField(
+        queryset=User.objects.trainees().only(*_USER_LABEL_FIELDS),
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        }),
+        widget=forms.Select(attrs=SELECT_ATTRS),
         help_text="Select a trainee"
     )
-    notes = forms.CharField(
+    notes = SharedCharField(
         required=False,
+        max_length=500,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'rows': 4,
             'placeholder': 'Optional notes about this assignment...'
         })
     )
-    is_active = forms.BooleanField(
+    is_active = SharedBooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'w-4 h-4 text-emerald-600 border-slate-300 rounded focus:ring-emerald-500'
-        })
+        widget=forms.CheckboxInput(attrs=CHECKBOX_ATTRS)
     )
 
     class Meta:
@@ -285,56 +282,22 @@ class TrainerTraineeAssignmentForm(forms.ModelForm):
         fields = ('trainer', 'trainee', 'notes', 'is_active')
 
     def __init__(self, *args, **kwargs):
-        user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         
-        # For new assignments, exclude already assigned trainees
-        # For editing, allow the current trainee to be selected
-        if self.instance and self.instance.pk:
-            # When editing, exclude other active assignments but allow the current one
-            assigned_trainee_ids = TrainerTraineeAssignment.objects.filter(
-                is_active=True
-            ).exclude(pk=self.instance.pk).values_list('trainee_id', flat=True)
-            self.fields['trainee'].queryset = self.fields['trainee'].queryset.exclude(
-                id__in=assigned_trainee_ids
-            )
-        else:
-            # For new assignments, exclude all assigned trainees
-            assigned_trainee_ids = TrainerTraineeAssignment.objects.filter(
-                is_active=True
-            ).values_list('trainee_id', flat=True)
-            self.fields['trainee'].queryset = self.fields['trainee'].queryset.exclude(
-                id__in=assigned_trainee_ids
-            )
-
-    def clean(self):
-        cleaned_data = super().clean()
-        trainer = cleaned_data.get('trainer')
-        trainee = cleaned_data.get('trainee')
-        
-        if trainer and trainee:
-            # Check if assignment already exists (excluding current instance if editing)
-            existing = TrainerTraineeAssignment.objects.filter(
-                trainer=trainer,
-                trainee=trainee,
-                is_active=True
-            )
-            if self.instance and self.instance.pk:
-                existing = existing.exclude(pk=self.instance.pk)
-            
-            if existing.exists():
-                raise forms.ValidationError(
-                    f"This trainee is already assigned to {trainer.get_full_name() or trainer.username}."
-                )
-        
-        return cleaned_data
+        # Exclude trainees that already have an active assignment. When
+        # editing an active assignment, it must not exclude its own trainee;
+        # an inactive one cannot be reactivated for a trainee assigned elsewhere.
+        available = models.Q(has_active_assignment=False)
+        if self.instance and self.instance.pk and self.instance.is_active:
+            available |= models.Q(pk=self.instance.trainee_id)
+        self.fields['trainee'].queryset = self.fields['trainee'].queryset.filter(available)
 
 
 class BulkAttendanceForm(forms.Form):
     """Form for bulk attendance marking."""
     
     trainees = forms.ModelMultipleChoiceField(
-        queryset=User.objects.filter(role=User.Role.TRAINEE, is_active=True),
+        queryset=User.objects.trainees(),
         required=True,
         widget=forms.CheckboxSelectMultiple(attrs={
             'class': 'space-y-2'
@@ -354,8 +317,9 @@ class BulkAttendanceForm(forms.Form):
     )
     notes = forms.CharField(
         required=False,
+        max_length=500,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'rows': 3,
             'placeholder': 'Optional notes for all selected trainees...'
         }),
@@ -379,30 +343,6 @@ class BulkAttendanceForm(forms.Form):
         if not trainees:
             raise forms.ValidationError('Please select at least one trainee.')
         return trainees
-    
-    def clean(self):
-        """Override clean to handle validation more gracefully."""
-        cleaned_data = super().clean()
-        
-        # If trainees validation failed but we have data in POST, try to recover
-        if 'trainees' not in cleaned_data and self.data:
-            trainee_ids = self.data.getlist('trainees')
-            if trainee_ids:
-                try:
-                    # Try to get the trainees directly
-                    trainees = User.objects.filter(
-                        id__in=[int(id) for id in trainee_ids if id.isdigit()],
-                        role=User.Role.TRAINEE,
-                        is_active=True
-                    )
-                    if trainees.exists():
-                        cleaned_data['trainees'] = trainees
-                    else:
-                        self.add_error('trainees', 'Please select at least one valid trainee.')
-                except (ValueError, TypeError):
-                    self.add_error('trainees', 'Invalid trainee selection.')
-        
-        return cleaned_data
 
 
 # Scheduling Forms
@@ -411,17 +351,15 @@ class TrainerAvailabilityForm(forms.ModelForm):
     """Form for creating and updating trainer availability."""
     
     day_of_week = forms.ChoiceField(
-        choices=TrainerAvailability.DayOfWeek.choices,
+        choices=lambda: _DAY_OF_WEEK_CHOICES,
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        }),
+        widget=forms.Select(attrs=SELECT_ATTRS),
         help_text="Select day of the week"
     )
     start_time = forms.TimeField(
         required=True,
         widget=forms.TimeInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'type': 'time'
         }),
         help_text="Start time"
@@ -429,7 +367,7 @@ class TrainerAvailabilityForm(forms.ModelForm):
     end_time = forms.TimeField(
         required=True,
         widget=forms.TimeInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'type': 'time'
         }),
         help_text="End time"
@@ -437,9 +375,7 @@ class TrainerAvailabilityForm(forms.ModelForm):
     is_available = forms.BooleanField(
         required=False,
         initial=True,
-        widget=forms.CheckboxInput(attrs={
-            'class': 'w-4 h-4 text-emerald-600 border-slate-300 rounded focus:ring-emerald-500'
-        })
+        widget=forms.CheckboxInput(attrs=CHECKBOX_ATTRS)
     )
 
     class Meta:
@@ -464,38 +400,41 @@ class TrainerAvailabilityForm(forms.ModelForm):
         return cleaned_data
 
 
+# Statuses of sessions that still occupy the trainer's time slot
+_ACTIVE_SESSION_STATUSES = (
+    TrainingSession.Status.SCHEDULED,
+    TrainingSession.Status.CONFIRMED,
+    TrainingSession.Status.IN_PROGRESS,
+)
+
+
 class TrainingSessionForm(forms.ModelForm):
     """Form for creating and updating training sessions."""
     
     trainer = forms.ModelChoiceField(
-        queryset=User.objects.filter(role=User.Role.TRAINER, is_active=True),
+        queryset=User.objects.trainers(),
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        }),
+        widget=forms.Select(attrs=SELECT_ATTRS),
         help_text="Select a trainer"
     )
     trainee = forms.ModelChoiceField(
-        queryset=User.objects.filter(role=User.Role.TRAINEE, is_active=True),
+        queryset=User.objects.trainees(),
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        }),
+        widget=forms.Select(attrs=SELECT_ATTRS),
         help_text="Select a trainee"
     )
     session_date = forms.DateField(
         required=True,
         widget=forms.DateInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
-            'type': 'date',
-            'min': timezone.now().date().isoformat()
+            'class': INPUT_CLASS,
+            'type': 'date'
         }),
         help_text="Date of the session"
     )
     start_time = forms.TimeField(
         required=True,
         widget=forms.TimeInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'type': 'time'
         }),
         help_text="Start time"
@@ -503,22 +442,21 @@ class TrainingSessionForm(forms.ModelForm):
     end_time = forms.TimeField(
         required=True,
         widget=forms.TimeInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'type': 'time'
         }),
         help_text="End time"
     )
     status = forms.ChoiceField(
-        choices=TrainingSession.Status.choices,
+        choices=lambda: _SESSION_STATUS_CHOICES,
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        })
+        widget=forms.Select(attrs=SELECT_ATTRS)
     )
     notes = forms.CharField(
         required=False,
+        max_length=500,
         widget=forms.Textarea(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'rows': 4,
             'placeholder': 'Optional notes about this session...'
         })
@@ -532,29 +470,33 @@ class TrainingSessionForm(forms.ModelForm):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         
+        # Sessions cannot be booked in the past; computed per form, not at import
+        self.fields['session_date'].widget.attrs['min'] = timezone.localdate().isoformat()
+        
         # If user is a trainee, limit to their assigned trainer
-        if user and user.is_trainee():
-            assignment = TrainerTraineeAssignment.objects.filter(
+        if user and user.is_trainee:
+            trainer_id = TrainerTraineeAssignment.objects.filter(
                 trainee=user,
                 is_active=True
-            ).first()
-            if assignment:
-                self.fields['trainer'].queryset = User.objects.filter(id=assignment.trainer_id, is_active=True)
-                self.fields['trainer'].initial = assignment.trainer
+            ).values_list('trainer_id', flat=True).first()
+            if trainer_id:
+                self.fields['trainer'].queryset = User.objects.filter(id=trainer_id, is_active=True)
+                self.fields['trainer'].initial = trainer_id
                 self.fields['trainee'].initial = user
                 self.fields['trainee'].widget.attrs['readonly'] = True
             else:
                 self.fields['trainer'].queryset = User.objects.none()
         
         # If user is a trainer, limit to their assigned trainees
-        elif user and user.is_trainer():
-            trainee_ids = TrainerTraineeAssignment.objects.filter(
+        elif user and user.is_trainer:
+            assigned = TrainerTraineeAssignment.objects.filter(
                 trainer=user,
-                is_active=True
-            ).values_list('trainee_id', flat=True)
+                is_active=True,
+                trainee_id=OuterRef('pk')
+            )
             self.fields['trainer'].initial = user
             self.fields['trainer'].widget.attrs['readonly'] = True
-            self.fields['trainee'].queryset = User.objects.filter(id__in=trainee_ids, is_active=True)
+            self.fields['trainee'].queryset = User.objects.filter(Exists(assigned), is_active=True)
 
     def clean(self):
         cleaned_data = super().clean()
@@ -565,7 +507,7 @@ class TrainingSessionForm(forms.ModelForm):
         
         if session_date and start_time and end_time:
             # Check if date is in the past
-            if session_date < timezone.now().date():
+            if session_date < timezone.localdate():
                 raise forms.ValidationError("Session date cannot be in the past.")
             
             # Check if end time is after start time
@@ -574,22 +516,15 @@ class TrainingSessionForm(forms.ModelForm):
             
             # Check for overlapping sessions
             if trainer:
-                session_datetime_start = timezone.make_aware(
-                    datetime.combine(session_date, start_time)
-                )
-                session_datetime_end = timezone.make_aware(
-                    datetime.combine(session_date, end_time)
-                )
-                
                 overlapping = TrainingSession.objects.filter(
                     trainer=trainer,
                     session_date=session_date,
-                    status__in=[TrainingSession.Status.SCHEDULED, TrainingSession.Status.CONFIRMED, TrainingSession.Status.IN_PROGRESS]
-                ).exclude(
-                    pk=self.instance.pk if self.instance.pk else None
-                ).filter(
-                    models.Q(start_time__lt=end_time, end_time__gt=start_time)
+                    status__in=_ACTIVE_SESSION_STATUSES,
+                    start_time__lt=end_time,
+                    end_time__gt=start_time
                 )
+                if self.instance.pk:
+                    overlapping = overlapping.exclude(pk=self.instance.pk)
                 
                 if overlapping.exists():
                     raise forms.ValidationError(
@@ -604,16 +539,14 @@ class SessionReminderForm(forms.ModelForm):
     """Form for creating session reminders."""
     
     reminder_type = forms.ChoiceField(
-        choices=SessionReminder.ReminderType.choices,
+        choices=lambda: _REMINDER_TYPE_CHOICES,
         required=True,
-        widget=forms.Select(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500'
-        })
+        widget=forms.Select(attrs=SELECT_ATTRS)
     )
     reminder_time = forms.DateTimeField(
         required=True,
         widget=forms.DateTimeInput(attrs={
-            'class': 'w-full px-4 py-2 border border-slate-300 rounded-lg focus:ring-2 focus:ring-emerald-500 focus:border-emerald-500',
+            'class': INPUT_CLASS,
             'type': 'datetime-local'
         }),
         help_text="When to send the reminder"
@@ -629,17 +562,17 @@ class SessionReminderForm(forms.ModelForm):
         if session:
             self.instance.session = session
             # Set default reminder time to 1 hour before session
-            if session.session_datetime_start:
-                default_time = session.session_datetime_start - timedelta(hours=1)
-                self.fields['reminder_time'].initial = default_time
+            session_start = session.start_dt
+            if session_start:
+                self.fields['reminder_time'].initial = session_start - timedelta(hours=1)
 
     def clean(self):
         cleaned_data = super().clean()
         reminder_time = cleaned_data.get('reminder_time')
-        session = self.instance.session if hasattr(self.instance, 'session') else None
+        session = getattr(self.instance, 'session', None)
         
         if reminder_time and session:
-            if reminder_time >= session.session_datetime_start:
+            if reminder_time >= session.start_dt:
                 raise forms.ValidationError("Reminder time must be before the session start time.")
         
         return cleaned_data
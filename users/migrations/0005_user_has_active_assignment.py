@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:44
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def backfill_has_active_assignment(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    TrainerTraineeAssignment = apps.get_model('users', 'TrainerTraineeAssignment')
+    User.objects.update(has_active_assignment=Exists(
+        TrainerTraineeAssignment.objects.filter(trainee_id=OuterRef('pk'), is_active=True)
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_trainingsession_sessionreminder_traineravailability_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='has_active_assignment',
+            field=models.BooleanField(db_index=True, default=False, editable=False, help_text='Whether this trainee currently has an active trainer assignment'),
+        ),
+        migrations.RunPython(backfill_has_active_assignment, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_manager_role_active_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='role_rank',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=models.Case(models.When(role='SUPER_ADMIN', then=models.Value(4)), models.When(role='OWNER', then=models.Value(3)), models.When(role='MANAGER', then=models.Value(2)), models.When(role='TRAINER', then=models.Value(1)), models.When(role='TRAINEE', then=models.Value(0)), default=models.Value(0)), output_field=models.PositiveSmallIntegerField()),
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='marked_by',
+            field=models.ForeignKey(blank=True, help_text='Trainer or staff member who marked this attendance (null if self-check-in)', limit_choices_to={'role_rank__gte': 1}, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='marked_attendances', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_user_role_rank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='trainingsession',
+            index=models.Index(fields=['trainer', 'session_date', 'start_time'], name='users_train_trainer_a934bc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trainingsession',
+            index=models.Index(fields=['trainee', 'session_date', 'start_time'], name='users_train_trainee_cdcc90_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trainingsession',
+            index=models.Index(condition=models.Q(('status__in', ['SCHEDULED', 'CONFIRMED'])), fields=['trainer', 'session_date'], name='ts_active_trainer_date'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_trainingsession_schedule_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sessionreminder',
+            name='users_sessi_reminde_7b80c3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('check_out__isnull', True)), fields=['trainee'], name='attendance_open'),
+        ),
+        migrations.AddIndex(
+            model_name='sessionreminder',
+            index=models.Index(condition=models.Q(('sent', False)), fields=['reminder_time'], name='reminder_pending_time'),
+        ),
+    ]
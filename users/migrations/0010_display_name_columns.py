@@ -0,0 +1,45 @@
+# Generated by Django 5.2.9 on 2026-10-15 22:59
+
+from django.db import migrations, models
+
+
+def _display_name(user):
+    return f"{user.first_name} {user.last_name}".strip() or user.username
+
+
+def backfill_display_names(apps, schema_editor):
+    TrainerTraineeAssignment = apps.get_model('users', 'TrainerTraineeAssignment')
+    Attendance = apps.get_model('users', 'Attendance')
+    for assignment in TrainerTraineeAssignment.objects.select_related('trainer', 'trainee'):
+        assignment.trainer_display = _display_name(assignment.trainer)
+        assignment.trainee_display = _display_name(assignment.trainee)
+        assignment.save(update_fields=['trainer_display', 'trainee_display'])
+    for attendance in Attendance.objects.select_related('trainee'):
+        attendance.trainee_display = _display_name(attendance.trainee)
+        attendance.save(update_fields=['trainee_display'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_pending_reminder_open_attendance_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='trainee_display',
+            field=models.CharField(blank=True, editable=False, help_text="Trainee's display name, kept in sync with the user", max_length=150),
+        ),
+        migrations.AddField(
+            model_name='trainertraineeassignment',
+            name='trainee_display',
+            field=models.CharField(blank=True, editable=False, help_text="Trainee's display name, kept in sync with the user", max_length=150),
+        ),
+        migrations.AddField(
+            model_name='trainertraineeassignment',
+            name='trainer_display',
+            field=models.CharField(blank=True, editable=False, help_text="Trainer's display name, kept in sync with the user", max_length=150),
+        ),
+        migrations.RunPython(backfill_display_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:00
+
+import users.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_display_name_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='duration_minutes',
+            field=models.GeneratedField(db_persist=True, expression=users.models.MinutesBetween('check_in', 'check_out'), output_field=models.IntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['duration_minutes'], name='users_atten_duratio_488e57_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:10
+
+from datetime import datetime
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_session_datetimes(apps, schema_editor):
+    TrainingSession = apps.get_model('users', 'TrainingSession')
+    for session in TrainingSession.objects.all():
+        session.start_dt = timezone.make_aware(datetime.combine(session.session_date, session.start_time))
+        session.end_dt = timezone.make_aware(datetime.combine(session.session_date, session.end_time))
+        session.save(update_fields=['start_dt', 'end_dt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_attendance_duration_minutes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainingsession',
+            name='start_dt',
+            field=models.DateTimeField(null=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='trainingsession',
+            name='end_dt',
+            field=models.DateTimeField(null=True, editable=False),
+        ),
+        migrations.RunPython(backfill_session_datetimes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='trainingsession',
+            name='start_dt',
+            field=models.DateTimeField(db_index=True, editable=False, help_text='Session start as an aware datetime, derived from date and start time'),
+        ),
+        migrations.AlterField(
+            model_name='trainingsession',
+            name='end_dt',
+            field=models.DateTimeField(editable=False, help_text='Session end as an aware datetime, derived from date and end time'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:03
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def close_duplicate_open_attendances(apps, schema_editor):
+    # Keep each trainee's latest open check-in; close older ones at their check-in time
+    Attendance = apps.get_model('users', 'Attendance')
+    seen = set()
+    stale = []
+    open_attendances = Attendance.objects.filter(check_out__isnull=True).order_by('trainee_id', '-check_in')
+    for pk, trainee_id in open_attendances.values_list('pk', 'trainee_id'):
+        if trainee_id in seen:
+            stale.append(pk)
+        seen.add(trainee_id)
+    Attendance.objects.filter(pk__in=stale).update(check_out=F('check_in'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_trainingsession_start_dt_end_dt'),
+    ]
+
+    operations = [
+        migrations.RunPython(close_duplicate_open_attendances, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='attendance_open',
+        ),
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(condition=models.Q(('check_out__isnull', True)), fields=('trainee',), name='one_open_attendance_per_trainee'),
+        ),
+    ]
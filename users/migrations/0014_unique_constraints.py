@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0013_one_open_attendance_per_trainee'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='traineravailability',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='trainertraineeassignment',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='traineravailability',
+            constraint=models.UniqueConstraint(fields=('trainer', 'day_of_week', 'start_time', 'end_time'), name='uniq_trainer_availability_slot'),
+        ),
+        migrations.AddConstraint(
+            model_name='trainertraineeassignment',
+            constraint=models.UniqueConstraint(fields=('trainer', 'trainee'), name='uniq_trainer_trainee'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:07
+
+from django.db import migrations, models
+
+
+def backfill_display_name(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    for user in User.objects.only('first_name', 'last_name', 'username'):
+        user.display_name = f"{user.first_name} {user.last_name}".strip() or user.username
+        user.save(update_fields=['display_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0014_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='display_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Full name, falling back to the username', max_length=150),
+        ),
+        migrations.RunPython(backfill_display_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0015_user_display_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attendance',
+            name='notes',
+            field=models.CharField(blank=True, help_text='Additional notes about this attendance', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='trainertraineeassignment',
+            name='notes',
+            field=models.CharField(blank=True, help_text='Additional notes about this assignment', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='trainingsession',
+            name='cancellation_reason',
+            field=models.CharField(blank=True, help_text='Reason for cancellation', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='trainingsession',
+            name='notes',
+            field=models.CharField(blank=True, help_text='Additional notes about this session', max_length=500, null=True),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:20
+
+from django.db import migrations, models
+
+
+def backfill_minutes_of_week(apps, schema_editor):
+    TrainerAvailability = apps.get_model('users', 'TrainerAvailability')
+    for availability in TrainerAvailability.objects.all():
+        day_start = availability.day_of_week * 1440
+        availability.start_mow = day_start + availability.start_time.hour * 60 + availability.start_time.minute
+        availability.end_mow = day_start + availability.end_time.hour * 60 + availability.end_time.minute
+        availability.save(update_fields=['start_mow', 'end_mow'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0016_short_notes_charfields'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='traineravailability',
+            options={'ordering': ['trainer', 'start_mow'], 'verbose_name': 'Trainer Availability', 'verbose_name_plural': 'Trainer Availabilities'},
+        ),
+        migrations.RemoveIndex(
+            model_name='traineravailability',
+            name='users_train_trainer_6444b9_idx',
+        ),
+        migrations.AddField(
+            model_name='traineravailability',
+            name='start_mow',
+            field=models.PositiveIntegerField(null=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='traineravailability',
+            name='end_mow',
+            field=models.PositiveIntegerField(null=True, editable=False),
+        ),
+        migrations.RunPython(backfill_minutes_of_week, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='traineravailability',
+            name='start_mow',
+            field=models.PositiveIntegerField(editable=False, help_text='Start as minutes since Monday 00:00, derived from day and start time'),
+        ),
+        migrations.AlterField(
+            model_name='traineravailability',
+            name='end_mow',
+            field=models.PositiveIntegerField(editable=False, help_text='End as minutes since Monday 00:00, derived from day and end time'),
+        ),
+        migrations.AddIndex(
+            model_name='traineravailability',
+            index=models.Index(fields=['trainer', 'is_available', 'start_mow'], name='users_train_trainer_9697c8_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0018_timestamp_mixin'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='users_atten_marked__0f3bb4_idx',
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['marked_by', '-check_in'], name='users_atten_marked__c21aa1_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 23:38
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0020_user_list_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='trainingsession',
+            name='ts_active_trainer_date',
+        ),
+    ]
@@ -11,7 +11,7 @@ class StaffOrAboveRequiredMixin(AccessMixin):
         if not request.user.is_authenticated:
             return self.handle_no_permission()
         
-        if not request.user.is_staff_or_above():
+        if not request.user.is_staff_or_above:
             raise PermissionDenied("You don't have permission to access this page.")
         
         return super().dispatch(request, *args, **kwargs)
@@ -25,7 +25,7 @@ class SuperAdminOrOwnerRequiredMixin(AccessMixin):
         if not request.user.is_authenticated:
             return self.handle_no_permission()
         
-        if not (request.user.is_super_admin() or request.user.is_owner()):
+        if not (request.user.is_super_admin or request.user.is_owner):
             raise PermissionDenied("You don't have permission to access this page.")
         
         return super().dispatch(request, *args, **kwargs)
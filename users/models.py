@@ -1,9 +1,154 @@
-from django.contrib.auth.models import AbstractUser
-from django.db import models
+from datetime import datetime
+
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
+from django.db import NotSupportedError, models
+from django.db.models.functions import Now
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+class UserManager(BaseUserManager):
+    """
+    Manager for User with shortcuts for active trainers and trainees.
+    """
+
+    def trainers(self):
+        return self.filter(role=User.Role.TRAINER, is_active=True)
+
+    def trainees(self):
+        return self.filter(role=User.Role.TRAINEE, is_active=True)
+
+
+class TimestampMixin(models.Model):
+    """
+    Abstract base stamping when a row was created and last updated.
+    """
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class MinutesBetween(models.Func):
+    """
+    Whole minutes elapsed from start to end, using only deterministic SQL so
+    it can back a generated column.
+    """
+    arity = 2
+    output_field = models.IntegerField()
+
+    def __init__(self, start, end, **extra):
+        super().__init__(end, start, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            f'MinutesBetween is not supported on {connection.display_name}.'
+        )
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template='CAST(FLOOR(EXTRACT(EPOCH FROM (%(expressions)s)) / 60) AS integer)',
+            arg_joiner=' - ',
+            **extra_context,
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler,
+            connection,
+            template='(CAST(ROUND((julianday(%(expressions)s)) * 86400000) AS integer) / 60000)',
+            arg_joiner=') - julianday(',
+            **extra_context,
+        )
+
+
+class AssignmentManager(models.Manager):
+    """
+    Manager that joins the users rendered by TrainerTraineeAssignment.__str__.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('trainer', 'trainee', 'assigned_by')
+
+
+class AttendanceQuerySet(models.QuerySet):
+    """
+    QuerySet for Attendance with aggregate statistics.
+    """
+
+    def stats(self, since=None):
+        """Visit count plus total and average minutes, optionally from a date on."""
+        queryset = self if since is None else self.filter(check_in__date__gte=since)
+        return queryset.aggregate(
+            sessions=models.Count('id'),
+            total_minutes=models.Sum('duration_minutes'),
+            avg_minutes=models.Avg('duration_minutes'),
+        )
+
+
+class AttendanceManager(models.Manager.from_queryset(AttendanceQuerySet)):
+    """
+    Manager that joins the trainee and marker of each attendance.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('trainee', 'marked_by')
 
 
-class User(AbstractUser):
+class TrainingSessionManager(models.Manager):
+    """
+    Manager that joins the users involved in each training session.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'trainer', 'trainee', 'created_by', 'cancelled_by'
+        )
+
+
+class SessionReminderQuerySet(models.QuerySet):
+    """
+    QuerySet for SessionReminder with shortcuts for the reminder dispatcher.
+    """
+
+    def due(self):
+        """Unsent reminders whose time has come, narrowed to what a dispatcher sends."""
+        return self.filter(sent=False, reminder_time__lte=timezone.now()).select_related(
+            'session__trainer', 'session__trainee'
+        ).only(
+            'id',
+            'reminder_type',
+            'reminder_time',
+            'session__session_date',
+            'session__start_time',
+            'session__trainer__email',
+            'session__trainee__email',
+        )
+
+    def mark_sent(self, at=None):
+        """
+        Flag every reminder in this queryset as sent with a single UPDATE.
+
+        Instances already loaded from the queryset are not refreshed. Concurrent
+        dispatchers should claim rows first with select_for_update(skip_locked=True).
+        """
+        now = timezone.now()
+        return self.update(sent=True, sent_at=at or now, updated_at=now)
+
+
+class SessionReminderManager(models.Manager.from_queryset(SessionReminderQuerySet)):
+    """
+    Manager that joins the session and its participants for each reminder.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('session__trainer', 'session__trainee')
+
+
+class User(TimestampMixin, AbstractUser):
     """
     Custom User model with role-based access control.
     """
@@ -15,6 +160,16 @@ class User(AbstractUser):
         TRAINER = "TRAINER", "Trainer"
         TRAINEE = "TRAINEE", "Trainee"
 
+    # Privilege rank per role; anything at or above STAFF_RANK is staff.
+    ROLE_RANKS = {
+        Role.SUPER_ADMIN: 4,
+        Role.OWNER: 3,
+        Role.MANAGER: 2,
+        Role.TRAINER: 1,
+        Role.TRAINEE: 0,
+    }
+    STAFF_RANK = 2
+
     role = models.CharField(
         max_length=20,
         choices=Role.choices,
@@ -30,38 +185,90 @@ class User(AbstractUser):
         null=True,
         help_text="User profile picture",
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    has_active_assignment = models.BooleanField(
+        default=False,
+        db_index=True,
+        editable=False,
+        help_text="Whether this trainee currently has an active trainer assignment",
+    )
+    display_name = models.CharField(
+        max_length=150,
+        db_index=True,
+        blank=True,
+        editable=False,
+        help_text="Full name, falling back to the username",
+    )
+    role_rank = models.GeneratedField(
+        expression=models.Case(
+            *[models.When(role=role, then=models.Value(rank)) for role, rank in ROLE_RANKS.items()],
+            default=models.Value(0),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+        db_index=True,
+    )
+
+    objects = UserManager()
 
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ["-date_joined"]
+        indexes = [
+            models.Index(fields=["role", "is_active"], name="user_role_active_idx"),
+            # User list pages walk these in order instead of sorting the table
+            models.Index(fields=["-date_joined"], name="user_date_joined_idx"),
+            models.Index(fields=["role", "-date_joined"], name="user_role_date_joined_idx"),
+        ]
 
     def __str__(self):
-        return f"{self.username} ({self.get_role_display()})"
+        return f"{self.username} ({ROLE_DISPLAY.get(self.role, self.role)})"
 
+    def save(self, *args, **kwargs):
+        self.display_name = self.get_full_name() or self.username
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'first_name', 'last_name', 'username'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'display_name'}
+        super().save(*args, **kwargs)
+
+    @cached_property
     def is_super_admin(self):
         return self.role == self.Role.SUPER_ADMIN
 
+    @cached_property
     def is_owner(self):
         return self.role == self.Role.OWNER
 
+    @cached_property
     def is_manager(self):
         return self.role == self.Role.MANAGER
 
+    @cached_property
     def is_trainer(self):
         return self.role == self.Role.TRAINER
 
+    @cached_property
     def is_trainee(self):
         return self.role == self.Role.TRAINEE
 
+    @cached_property
     def is_staff_or_above(self):
         """Check if user has staff-level access or above"""
-        return self.role in [self.Role.SUPER_ADMIN, self.Role.OWNER, self.Role.MANAGER]
+        return self.role in STAFF_ROLES
+
+    @cached_property
+    def role_tier(self):
+        """Staff role that decides which roles this user may assign, or None"""
+        return self.role if self.is_staff_or_above else None
 
 
-class TrainerTraineeAssignment(models.Model):
+ROLE_DISPLAY = dict(User.Role.choices)
+STAFF_ROLES = frozenset(
+    role for role, rank in User.ROLE_RANKS.items() if rank >= User.STAFF_RANK
+)
+
+
+class TrainerTraineeAssignment(TimestampMixin):
     """
     Model to track assignments between trainers and trainees.
     """
@@ -88,7 +295,8 @@ class TrainerTraineeAssignment(models.Model):
         help_text="User who made this assignment"
     )
     assigned_at = models.DateTimeField(auto_now_add=True, help_text="When the assignment was created")
-    notes = models.TextField(
+    notes = models.CharField(
+        max_length=500,
         blank=True,
         null=True,
         help_text="Additional notes about this assignment"
@@ -97,24 +305,43 @@ class TrainerTraineeAssignment(models.Model):
         default=True,
         help_text="Whether this assignment is currently active"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    trainer_display = models.CharField(
+        max_length=150,
+        blank=True,
+        editable=False,
+        help_text="Trainer's display name, kept in sync with the user"
+    )
+    trainee_display = models.CharField(
+        max_length=150,
+        blank=True,
+        editable=False,
+        help_text="Trainee's display name, kept in sync with the user"
+    )
+
+    objects = AssignmentManager()
 
     class Meta:
         verbose_name = "Trainer-Trainee Assignment"
         verbose_name_plural = "Trainer-Trainee Assignments"
         ordering = ['-assigned_at']
-        unique_together = [['trainer', 'trainee']]
         indexes = [
             models.Index(fields=['trainer', 'is_active']),
             models.Index(fields=['trainee', 'is_active']),
         ]
+        constraints = [
+            models.UniqueConstraint(fields=['trainer', 'trainee'], name='uniq_trainer_trainee'),
+        ]
 
     def __str__(self):
-        return f"{self.trainer.get_full_name() or self.trainer.username} -> {self.trainee.get_full_name() or self.trainee.username}"
+        return f"{self.trainer_display} -> {self.trainee_display}"
 
+    def save(self, *args, **kwargs):
+        self.trainer_display = self.trainer.display_name
+        self.trainee_display = self.trainee.display_name
+        super().save(*args, **kwargs)
 
-class Attendance(models.Model):
+
+class Attendance(TimestampMixin):
     """
     Model to track attendance (check-in/check-out) for trainees.
     """
@@ -139,16 +366,28 @@ class Attendance(models.Model):
         null=True,
         blank=True,
         related_name='marked_attendances',
-        limit_choices_to={'role__in': [User.Role.TRAINER, User.Role.MANAGER, User.Role.OWNER, User.Role.SUPER_ADMIN]},
+        limit_choices_to={'role_rank__gte': User.ROLE_RANKS[User.Role.TRAINER]},
         help_text="Trainer or staff member who marked this attendance (null if self-check-in)"
     )
-    notes = models.TextField(
+    notes = models.CharField(
+        max_length=500,
         blank=True,
         null=True,
         help_text="Additional notes about this attendance"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    trainee_display = models.CharField(
+        max_length=150,
+        blank=True,
+        editable=False,
+        help_text="Trainee's display name, kept in sync with the user"
+    )
+    duration_minutes = models.GeneratedField(
+        expression=MinutesBetween('check_in', 'check_out'),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
+    objects = AttendanceManager()
 
     class Meta:
         verbose_name = "Attendance"
@@ -157,27 +396,30 @@ class Attendance(models.Model):
         indexes = [
             models.Index(fields=['trainee', '-check_in']),
             models.Index(fields=['check_in']),
-            models.Index(fields=['marked_by']),
+            models.Index(fields=['marked_by', '-check_in']),
+            models.Index(fields=['duration_minutes']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['trainee'],
+                condition=models.Q(check_out__isnull=True),
+                name='one_open_attendance_per_trainee',
+            ),
         ]
 
     def __str__(self):
         check_out_status = f" - {self.check_out.strftime('%H:%M')}" if self.check_out else " (Checked In)"
-        return f"{self.trainee.get_full_name() or self.trainee.username} - {self.check_in.strftime('%Y-%m-%d %H:%M')}{check_out_status}"
+        return f"{self.trainee_display} - {self.check_in.strftime('%Y-%m-%d %H:%M')}{check_out_status}"
 
-    @property
-    def duration(self):
-        """Calculate duration in minutes if checked out."""
-        if self.check_out:
-            delta = self.check_out - self.check_in
-            return int(delta.total_seconds() / 60)
-        return None
+    def save(self, *args, **kwargs):
+        self.trainee_display = self.trainee.display_name
+        super().save(*args, **kwargs)
 
     def get_duration_display(self):
         """Get formatted duration string."""
-        if not self.duration:
+        if self.duration_minutes is None:
             return "—"
-        hours = self.duration // 60
-        minutes = self.duration % 60
+        hours, minutes = divmod(self.duration_minutes, 60)
         if hours > 0:
             return f"{hours}h {minutes}m"
         return f"{minutes}m"
@@ -187,13 +429,18 @@ class Attendance(models.Model):
         """Check if trainee is currently checked in."""
         return self.check_out is None
 
+    @classmethod
+    def currently_checked_in_trainee_ids(cls):
+        """IDs of trainees with an open attendance."""
+        return cls.objects.filter(check_out__isnull=True).values_list('trainee_id', flat=True)
+
     @property
     def date(self):
         """Get the date of attendance."""
         return self.check_in.date()
 
 
-class TrainerAvailability(models.Model):
+class TrainerAvailability(TimestampMixin):
     """
     Model to track trainer availability schedules.
     """
@@ -227,23 +474,47 @@ class TrainerAvailability(models.Model):
         default=True,
         help_text="Whether this time slot is currently available"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    start_mow = models.PositiveIntegerField(
+        editable=False,
+        help_text="Start as minutes since Monday 00:00, derived from day and start time"
+    )
+    end_mow = models.PositiveIntegerField(
+        editable=False,
+        help_text="End as minutes since Monday 00:00, derived from day and end time"
+    )
 
     class Meta:
         verbose_name = "Trainer Availability"
         verbose_name_plural = "Trainer Availabilities"
-        ordering = ['trainer', 'day_of_week', 'start_time']
-        unique_together = [['trainer', 'day_of_week', 'start_time', 'end_time']]
+        ordering = ['trainer', 'start_mow']
         indexes = [
-            models.Index(fields=['trainer', 'day_of_week', 'is_available']),
+            models.Index(fields=['trainer', 'is_available', 'start_mow']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['trainer', 'day_of_week', 'start_time', 'end_time'],
+                name='uniq_trainer_availability_slot',
+            ),
         ]
 
     def __str__(self):
-        return f"{self.trainer.get_full_name() or self.trainer.username} - {self.get_day_of_week_display()} {self.start_time.strftime('%H:%M')}-{self.end_time.strftime('%H:%M')}"
+        return f"{self.trainer.display_name} - {self.get_day_of_week_display()} {self.start_time.strftime('%H:%M')}-{self.end_time.strftime('%H:%M')}"
 
+    @staticmethod
+    def minute_of_week(day_of_week, at):
+        """Minutes from Monday 00:00 to the given weekday and time."""
+        return int(day_of_week) * 1440 + at.hour * 60 + at.minute
 
-class TrainingSession(models.Model):
+    def save(self, *args, **kwargs):
+        self.start_mow = self.minute_of_week(self.day_of_week, self.start_time)
+        self.end_mow = self.minute_of_week(self.day_of_week, self.end_time)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'day_of_week', 'start_time', 'end_time'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'start_mow', 'end_mow'}
+        super().save(*args, **kwargs)
+
+
+class TrainingSession(TimestampMixin):
     """
     Model to track booked training sessions/appointments.
     """
@@ -284,7 +555,8 @@ class TrainingSession(models.Model):
         default=Status.SCHEDULED,
         help_text="Current status of the session"
     )
-    notes = models.TextField(
+    notes = models.CharField(
+        max_length=500,
         blank=True,
         null=True,
         help_text="Additional notes about this session"
@@ -302,7 +574,8 @@ class TrainingSession(models.Model):
         related_name='cancelled_sessions',
         help_text="User who cancelled the session"
     )
-    cancellation_reason = models.TextField(
+    cancellation_reason = models.CharField(
+        max_length=500,
         blank=True,
         null=True,
         help_text="Reason for cancellation"
@@ -315,8 +588,17 @@ class TrainingSession(models.Model):
         related_name='created_sessions',
         help_text="User who created this booking"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    start_dt = models.DateTimeField(
+        db_index=True,
+        editable=False,
+        help_text="Session start as an aware datetime, derived from date and start time"
+    )
+    end_dt = models.DateTimeField(
+        editable=False,
+        help_text="Session end as an aware datetime, derived from date and end time"
+    )
+
+    objects = TrainingSessionManager()
 
     class Meta:
         verbose_name = "Training Session"
@@ -326,50 +608,38 @@ class TrainingSession(models.Model):
             models.Index(fields=['trainer', 'session_date', 'status']),
             models.Index(fields=['trainee', 'session_date', 'status']),
             models.Index(fields=['session_date', 'start_time']),
+            models.Index(fields=['trainer', 'session_date', 'start_time']),
+            models.Index(fields=['trainee', 'session_date', 'start_time']),
         ]
 
     def __str__(self):
-        return f"{self.trainee.get_full_name() or self.trainee.username} with {self.trainer.get_full_name() or self.trainer.username} - {self.session_date} {self.start_time.strftime('%H:%M')}"
+        return f"{self.trainee.display_name} with {self.trainer.display_name} - {self.session_date} {self.start_time.strftime('%H:%M')}"
 
-    @property
-    def session_datetime_start(self):
-        """Get the full datetime for session start."""
-        from django.utils import timezone
-        return timezone.make_aware(
-            timezone.datetime.combine(self.session_date, self.start_time)
-        )
-
-    @property
-    def session_datetime_end(self):
-        """Get the full datetime for session end."""
-        from django.utils import timezone
-        return timezone.make_aware(
-            timezone.datetime.combine(self.session_date, self.end_time)
-        )
+    def save(self, *args, **kwargs):
+        self.start_dt = timezone.make_aware(datetime.combine(self.session_date, self.start_time))
+        self.end_dt = timezone.make_aware(datetime.combine(self.session_date, self.end_time))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'session_date', 'start_time', 'end_time'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'start_dt', 'end_dt'}
+        super().save(*args, **kwargs)
 
     @property
     def is_upcoming(self):
         """Check if session is in the future."""
-        from django.utils import timezone
-        return self.session_datetime_start > timezone.now()
+        return self.start_dt > timezone.now()
 
     @property
     def is_past(self):
         """Check if session is in the past."""
-        from django.utils import timezone
-        return self.session_datetime_end < timezone.now()
+        return self.end_dt < timezone.now()
 
     @property
     def duration_minutes(self):
         """Calculate session duration in minutes."""
-        from datetime import datetime
-        start = datetime.combine(self.session_date, self.start_time)
-        end = datetime.combine(self.session_date, self.end_time)
-        delta = end - start
-        return int(delta.total_seconds() / 60)
+        return int((self.end_dt - self.start_dt).total_seconds() / 60)
 
 
-class SessionReminder(models.Model):
+class SessionReminder(TimestampMixin):
     """
     Model to track reminders for training sessions.
     """
@@ -402,8 +672,8 @@ class SessionReminder(models.Model):
         blank=True,
         help_text="When the reminder was sent"
     )
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SessionReminderManager()
 
     class Meta:
         verbose_name = "Session Reminder"
@@ -411,7 +681,11 @@ class SessionReminder(models.Model):
         ordering = ['reminder_time']
         indexes = [
             models.Index(fields=['session', 'sent']),
-            models.Index(fields=['reminder_time', 'sent']),
+            models.Index(
+                fields=['reminder_time'],
+                condition=models.Q(sent=False),
+                name='reminder_pending_time',
+            ),
         ]
 
     def __str__(self):
@@ -420,5 +694,4 @@ class SessionReminder(models.Model):
     @property
     def is_due(self):
         """Check if reminder is due to be sent."""
-        from django.utils import timezone
         return not self.sent and self.reminder_time <= timezone.now()
@@ -0,0 +1,54 @@
+from django.db.models import Exists, OuterRef
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Attendance, User, TrainerTraineeAssignment
+
+
+def sync_has_active_assignment(trainee_ids):
+    """Recompute User.has_active_assignment for the given trainees."""
+    User.objects.filter(pk__in=trainee_ids).update(has_active_assignment=Exists(
+        TrainerTraineeAssignment.objects.filter(trainee_id=OuterRef('pk'), is_active=True)
+    ))
+
+
+@receiver(pre_save, sender=TrainerTraineeAssignment)
+def remember_previous_trainee(sender, instance, **kwargs):
+    # An edit may move the assignment to another trainee; the old one needs a resync too
+    instance._previous_trainee_id = None
+    if instance.pk:
+        instance._previous_trainee_id = sender.objects.filter(
+            pk=instance.pk
+        ).values_list('trainee_id', flat=True).first()
+
+
+@receiver(post_save, sender=TrainerTraineeAssignment)
+def assignment_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sync_has_active_assignment({instance.trainee_id, instance._previous_trainee_id} - {None})
+
+
+@receiver(post_delete, sender=TrainerTraineeAssignment)
+def assignment_deleted(sender, instance, **kwargs):
+    sync_has_active_assignment([instance.trainee_id])
+
+
+_DISPLAY_NAME_FIELDS = {'first_name', 'last_name', 'username'}
+
+
+@receiver(post_save, sender=User)
+def sync_display_names(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Refresh the denormalised display names copied from this user."""
+    if raw or (update_fields is not None and not _DISPLAY_NAME_FIELDS & set(update_fields)):
+        return
+    name = instance.display_name
+    TrainerTraineeAssignment.objects.filter(trainer=instance).exclude(
+        trainer_display=name
+    ).update(trainer_display=name)
+    TrainerTraineeAssignment.objects.filter(trainee=instance).exclude(
+        trainee_display=name
+    ).update(trainee_display=name)
+    Attendance.objects.filter(trainee=instance).exclude(
+        trainee_display=name
+    ).update(trainee_display=name)
@@ -1,3 +1,76 @@
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .forms import TrainerTraineeAssignmentForm
+from .models import Attendance, TrainerTraineeAssignment, User
+
+
+class TrainerTraineeAssignmentFormTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.trainer1 = User.objects.create_user('trainer1', password='x', role=User.Role.TRAINER)
+        cls.trainer2 = User.objects.create_user('trainer2', password='x', role=User.Role.TRAINER)
+        cls.trainee = User.objects.create_user('trainee', password='x', role=User.Role.TRAINEE)
+        cls.inactive = TrainerTraineeAssignment.objects.create(
+            trainer=cls.trainer1, trainee=cls.trainee, is_active=False
+        )
+        cls.active = TrainerTraineeAssignment.objects.create(
+            trainer=cls.trainer2, trainee=cls.trainee, is_active=True
+        )
+
+    def test_reactivate_rejected_when_trainee_active_elsewhere(self):
+        form = TrainerTraineeAssignmentForm(
+            data={'trainer': self.trainer1.pk, 'trainee': self.trainee.pk, 'is_active': 'on'},
+            instance=self.inactive,
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn('trainee', form.errors)
+        self.assertEqual(
+            TrainerTraineeAssignment.objects.filter(trainee=self.trainee, is_active=True).count(), 1
+        )
+
+    def test_edit_active_assignment_keeps_its_trainee(self):
+        form = TrainerTraineeAssignmentForm(
+            data={'trainer': self.trainer2.pk, 'trainee': self.trainee.pk, 'is_active': 'on', 'notes': 'Updated'},
+            instance=self.active,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_edit_to_existing_pair_rejected(self):
+        form = TrainerTraineeAssignmentForm(
+            data={'trainer': self.trainer1.pk, 'trainee': self.trainee.pk, 'is_active': 'on'},
+            instance=self.active,
+        )
+        self.assertFalse(form.is_valid())
+        self.assertTrue(form.non_field_errors())
+
+
+class TrainerMarkAttendanceNotesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.trainer = User.objects.create_user('trainer', password='x', role=User.Role.TRAINER)
+        cls.trainee = User.objects.create_user('trainee', password='x', role=User.Role.TRAINEE)
+        TrainerTraineeAssignment.objects.create(trainer=cls.trainer, trainee=cls.trainee, is_active=True)
+
+    def setUp(self):
+        self.client.force_login(self.trainer)
+
+    def mark(self, action, notes):
+        return self.client.post(
+            reverse('users:trainer_mark_attendance'),
+            {'trainee_id': self.trainee.pk, 'action': action, 'notes': notes},
+            follow=True,
+        )
+
+    def test_overlong_notes_rejected(self):
+        response = self.mark('check_in', 'x' * 501)
+        self.assertContains(response, 'Notes cannot be longer than 500 characters.')
+        self.assertFalse(Attendance.objects.filter(trainee=self.trainee).exists())
+
+    def test_check_out_note_that_does_not_fit_is_reported(self):
+        self.mark('check_in', 'x' * 495)
+        response = self.mark('check_out', 'left early')
+        attendance = Attendance.objects.get(trainee=self.trainee)
+        self.assertIsNotNone(attendance.check_out)
+        self.assertEqual(attendance.notes, 'x' * 495)
+        self.assertContains(response, 'Notes were not saved')
@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import include, path
 from .views import (
     LoginView, LogoutView, UserListView, UserCreateView, UserUpdateView, UserDeleteView,
     ProfileView, ProfileUpdateView, ProfilePasswordChangeView,
@@ -14,45 +14,75 @@ from .views import (
 
 app_name = 'users'
 
+# Trainer-Trainee Assignment URLs
+assignment_patterns = [
+    path('', AssignmentListView.as_view(), name='assignment_list'),
+    path('create/', AssignmentCreateView.as_view(), name='assignment_create'),
+    path('<int:pk>/update/', AssignmentUpdateView.as_view(), name='assignment_update'),
+    path('<int:pk>/delete/', AssignmentDeleteView.as_view(), name='assignment_delete'),
+]
+
+# Attendance URLs
+attendance_patterns = [
+    path('check-in/', AttendanceCheckInView.as_view(), name='attendance_check_in'),
+    path('check-in/action/', CheckInView.as_view(), name='check_in'),
+    path('check-out/action/', CheckOutView.as_view(), name='check_out'),
+    path('history/', AttendanceHistoryView.as_view(), name='attendance_history'),
+    path('statistics/', AttendanceStatisticsView.as_view(), name='attendance_statistics'),
+    path('trainer/mark/', TrainerMarkAttendanceView.as_view(), name='trainer_mark_attendance'),
+    path('bulk-mark/', BulkAttendanceMarkView.as_view(), name='bulk_attendance_mark'),
+]
+
+# User management URLs, below users/<pk>/
+user_patterns = [
+    path('update/', UserUpdateView.as_view(), name='user_update'),
+    path('delete/', UserDeleteView.as_view(), name='user_delete'),
+]
+
+# Profile URLs
+profile_patterns = [
+    path('', ProfileView.as_view(), name='profile'),
+    path('edit/', ProfileUpdateView.as_view(), name='profile_edit'),
+    path('change-password/', ProfilePasswordChangeView.as_view(), name='profile_password_change'),
+]
+
+# Scheduling URLs
+availability_patterns = [
+    path('', TrainerAvailabilityListView.as_view(), name='trainer_availability_list'),
+    path('create/', TrainerAvailabilityCreateView.as_view(), name='trainer_availability_create'),
+    path('<int:pk>/update/', TrainerAvailabilityUpdateView.as_view(), name='trainer_availability_update'),
+    path('<int:pk>/delete/', TrainerAvailabilityDeleteView.as_view(), name='trainer_availability_delete'),
+]
+
+session_patterns = [
+    path('', TrainingSessionListView.as_view(), name='training_session_list'),
+    path('create/', TrainingSessionCreateView.as_view(), name='training_session_create'),
+    path('<int:pk>/update/', TrainingSessionUpdateView.as_view(), name='training_session_update'),
+    path('<int:pk>/delete/', TrainingSessionDeleteView.as_view(), name='training_session_delete'),
+    path('cancel/', TrainingSessionCancelView.as_view(), name='training_session_cancel'),
+]
+
+reminder_patterns = [
+    path('', SessionReminderListView.as_view(), name='session_reminder_list'),
+    path('create/', SessionReminderCreateView.as_view(), name='session_reminder_create'),
+    path('<int:pk>/delete/', SessionReminderDeleteView.as_view(), name='session_reminder_delete'),
+]
+
 urlpatterns = [
     path('login/', LoginView.as_view(), name='login'),
     path('logout/', LogoutView.as_view(), name='logout'),
-    path('profile/', ProfileView.as_view(), name='profile'),
-    path('profile/edit/', ProfileUpdateView.as_view(), name='profile_edit'),
-    path('profile/change-password/', ProfilePasswordChangeView.as_view(), name='profile_password_change'),
+    path('profile/', include(profile_patterns)),
     path('', UserListView.as_view(), name='user_list'),
     path('create/', UserCreateView.as_view(), name='user_create'),
-    path('<int:pk>/update/', UserUpdateView.as_view(), name='user_update'),
-    path('<int:pk>/delete/', UserDeleteView.as_view(), name='user_delete'),
-    # Trainer-Trainee Assignment URLs
-    path('assignments/', AssignmentListView.as_view(), name='assignment_list'),
-    path('assignments/create/', AssignmentCreateView.as_view(), name='assignment_create'),
-    path('assignments/<int:pk>/update/', AssignmentUpdateView.as_view(), name='assignment_update'),
-    path('assignments/<int:pk>/delete/', AssignmentDeleteView.as_view(), name='assignment_delete'),
+    path('<int:pk>/', include(user_patterns)),
+    path('assignments/', include(assignment_patterns)),
     # Trainer and Trainee views
     path('trainer/trainees/', TrainerTraineesView.as_view(), name='trainer_trainees'),
     path('trainee/trainer/', TraineeTrainerView.as_view(), name='trainee_trainer'),
-    # Attendance URLs
-    path('attendance/check-in/', AttendanceCheckInView.as_view(), name='attendance_check_in'),
-    path('attendance/check-in/action/', CheckInView.as_view(), name='check_in'),
-    path('attendance/check-out/action/', CheckOutView.as_view(), name='check_out'),
-    path('attendance/history/', AttendanceHistoryView.as_view(), name='attendance_history'),
-    path('attendance/statistics/', AttendanceStatisticsView.as_view(), name='attendance_statistics'),
-    path('attendance/trainer/mark/', TrainerMarkAttendanceView.as_view(), name='trainer_mark_attendance'),
-    path('attendance/bulk-mark/', BulkAttendanceMarkView.as_view(), name='bulk_attendance_mark'),
-    # Scheduling URLs
-    path('availability/', TrainerAvailabilityListView.as_view(), name='trainer_availability_list'),
-    path('availability/create/', TrainerAvailabilityCreateView.as_view(), name='trainer_availability_create'),
-    path('availability/<int:pk>/update/', TrainerAvailabilityUpdateView.as_view(), name='trainer_availability_update'),
-    path('availability/<int:pk>/delete/', TrainerAvailabilityDeleteView.as_view(), name='trainer_availability_delete'),
-    path('sessions/', TrainingSessionListView.as_view(), name='training_session_list'),
-    path('sessions/create/', TrainingSessionCreateView.as_view(), name='training_session_create'),
-    path('sessions/<int:pk>/update/', TrainingSessionUpdateView.as_view(), name='training_session_update'),
-    path('sessions/<int:pk>/delete/', TrainingSessionDeleteView.as_view(), name='training_session_delete'),
-    path('sessions/cancel/', TrainingSessionCancelView.as_view(), name='training_session_cancel'),
+    path('attendance/', include(attendance_patterns)),
+    path('availability/', include(availability_patterns)),
+    path('sessions/', include(session_patterns)),
     path('calendar/', CalendarView.as_view(), name='calendar'),
-    path('reminders/', SessionReminderListView.as_view(), name='session_reminder_list'),
-    path('reminders/create/', SessionReminderCreateView.as_view(), name='session_reminder_create'),
-    path('reminders/<int:pk>/delete/', SessionReminderDeleteView.as_view(), name='session_reminder_delete'),
+    path('reminders/', include(reminder_patterns)),
 ]
 
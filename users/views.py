@@ -3,12 +3,9 @@ from django.contrib.auth import authenticate, login, logout, update_session_auth
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.views.generic import TemplateView, View, ListView, CreateView, UpdateView, DeleteView, FormView
-from django.utils.decorators import method_decorator
-from django.views.decorators.csrf import csrf_protect
-from django.views.decorators.http import require_http_methods
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.urls import reverse_lazy
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.utils import timezone
 from datetime import datetime, timedelta
 from django.db.models import Count, Q, Avg, Sum
@@ -16,10 +13,31 @@ from .models import User, TrainerTraineeAssignment, Attendance, TrainerAvailabil
 from .forms import (
     UserForm, UserUpdateForm, ProfileForm, ProfilePasswordChangeForm, 
     TrainerTraineeAssignmentForm, BulkAttendanceForm,
-    TrainerAvailabilityForm, TrainingSessionForm, SessionReminderForm
+    TrainerAvailabilityForm, TrainingSessionForm, SessionReminderForm,
+    role_limited_form, assignable_role_choices
 )
 from .mixins import StaffOrAboveRequiredMixin, SuperAdminOrOwnerRequiredMixin
 
+# Success URLs shared by the create/update/delete views
+_USER_LIST_URL = reverse_lazy('users:user_list')
+_PROFILE_URL = reverse_lazy('users:profile')
+_ASSIGNMENT_LIST_URL = reverse_lazy('users:assignment_list')
+_AVAILABILITY_LIST_URL = reverse_lazy('users:trainer_availability_list')
+_SESSION_LIST_URL = reverse_lazy('users:training_session_list')
+_REMINDER_LIST_URL = reverse_lazy('users:session_reminder_list')
+
+# Limits for free-text POST values, taken from the model fields they are saved to
+_ATTENDANCE_NOTES_MAX_LENGTH = Attendance._meta.get_field('notes').max_length
+_CANCELLATION_REASON_MAX_LENGTH = TrainingSession._meta.get_field('cancellation_reason').max_length
+
+# Users each staff tier may see in the user list; Super Admin sees everyone
+_USER_LIST_SCOPE_BY_TIER = {
+    # Managers can only see Trainees
+    User.Role.MANAGER: Q(role=User.Role.TRAINEE),
+    # Owners can see Trainees and Managers
+    User.Role.OWNER: Q(role__in=[User.Role.TRAINEE, User.Role.MANAGER]),
+}
+
 
 class LoginView(TemplateView):
     """
@@ -86,11 +104,8 @@ class LogoutView(View):
     """
     Custom logout view using class-based view.
     """
-    
-    @method_decorator(require_http_methods(["POST"]))
-    @method_decorator(csrf_protect)
-    def dispatch(self, request, *args, **kwargs):
-        return super().dispatch(request, *args, **kwargs)
+    # POST only; CSRF is enforced globally by CsrfViewMiddleware
+    http_method_names = ['post']
 
     def post(self, request, *args, **kwargs):
         """Handle POST request for logout."""
@@ -108,64 +123,47 @@ class UserListView(StaffOrAboveRequiredMixin, ListView):
     login_url = "users:login"
 
     def get_queryset(self):
-        queryset = User.objects.all()
+        # Only the columns the user table renders
+        queryset = User.objects.only(
+            'username', 'first_name', 'last_name', 'email', 'phone_number',
+            'role', 'is_active', 'profile_picture',
+        )
         current_user = self.request.user
         search_query = self.request.GET.get('search', '')
         role_filter = self.request.GET.get('role', '')
         status_filter = self.request.GET.get('status', '')
-        
-        # Filter based on user role
-        if current_user.is_manager():
-            # Managers can only see Trainees
-            queryset = queryset.filter(role=User.Role.TRAINEE)
-        elif current_user.is_owner():
-            # Owners can see Trainees and Managers
-            queryset = queryset.filter(role__in=[User.Role.TRAINEE, User.Role.MANAGER])
-        # Super Admin can see all users
+        # Conditions are combined into one Q and applied with a single filter()
+        filters = _USER_LIST_SCOPE_BY_TIER.get(current_user.role_tier, Q())
         
         # Role filter
         if role_filter:
-            queryset = queryset.filter(role=role_filter)
+            filters &= Q(role=role_filter)
         
         # Status filter
         if status_filter == 'active':
-            queryset = queryset.filter(is_active=True)
+            filters &= Q(is_active=True)
         elif status_filter == 'inactive':
-            queryset = queryset.filter(is_active=False)
+            filters &= Q(is_active=False)
         
         # Search functionality
         if search_query:
-            queryset = queryset.filter(
-                models.Q(username__icontains=search_query) |
-                models.Q(first_name__icontains=search_query) |
-                models.Q(last_name__icontains=search_query) |
-                models.Q(email__icontains=search_query) |
-                models.Q(phone_number__icontains=search_query)
+            filters &= (
+                Q(username__icontains=search_query) |
+                Q(first_name__icontains=search_query) |
+                Q(last_name__icontains=search_query) |
+                Q(email__icontains=search_query) |
+                Q(phone_number__icontains=search_query)
             )
         
-        return queryset.order_by('-date_joined')
+        return queryset.filter(filters).order_by('-date_joined')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
         context['role_filter'] = self.request.GET.get('role', '')
         context['status_filter'] = self.request.GET.get('status', '')
-        context['form'] = UserForm(user=self.request.user)
-        
-        # Get available roles based on current user
-        current_user = self.request.user
-        if current_user.is_super_admin():
-            context['available_roles'] = User.Role.choices
-        elif current_user.is_owner():
-            context['available_roles'] = [
-                choice for choice in User.Role.choices 
-                if choice[0] != User.Role.SUPER_ADMIN
-            ]
-        elif current_user.is_manager():
-            context['available_roles'] = [(User.Role.TRAINEE, User.Role.TRAINEE.label)]
-        else:
-            context['available_roles'] = []
-        
+        # Roles available to the current user, from the tables built at import
+        context['available_roles'] = assignable_role_choices(self.request.user.role_tier)
         return context
 
 
@@ -176,10 +174,8 @@ class UserCreateView(StaffOrAboveRequiredMixin, CreateView):
     template_name = "users/user_create.html"
     login_url = "users:login"
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs['user'] = self.request.user
-        return kwargs
+    def get_form_class(self):
+        return role_limited_form(UserForm, self.request.user.role_tier)
 
     def form_valid(self, form):
         user = form.save()
@@ -187,7 +183,7 @@ class UserCreateView(StaffOrAboveRequiredMixin, CreateView):
         return redirect('users:user_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:user_list')
+        return _USER_LIST_URL
 
 
 class UserUpdateView(StaffOrAboveRequiredMixin, UpdateView):
@@ -197,10 +193,8 @@ class UserUpdateView(StaffOrAboveRequiredMixin, UpdateView):
     template_name = "users/user_update.html"
     login_url = "users:login"
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs['user'] = self.request.user
-        return kwargs
+    def get_form_class(self):
+        return role_limited_form(UserUpdateForm, self.request.user.role_tier)
 
     def form_valid(self, form):
         user = form.save()
@@ -208,7 +202,7 @@ class UserUpdateView(StaffOrAboveRequiredMixin, UpdateView):
         return redirect('users:user_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:user_list')
+        return _USER_LIST_URL
 
 
 class UserDeleteView(SuperAdminOrOwnerRequiredMixin, DeleteView):
@@ -217,21 +211,23 @@ class UserDeleteView(SuperAdminOrOwnerRequiredMixin, DeleteView):
     template_name = "users/user_confirm_delete.html"
     login_url = "users:login"
 
-    def delete(self, request, *args, **kwargs):
-        user = self.get_object()
-        username = user.get_full_name() or user.username
-        
-        # Prevent self-deletion
-        if user == request.user:
+    def post(self, request, *args, **kwargs):
+        # Prevent self-deletion; the pk is enough, no need to load the row
+        if self.kwargs['pk'] == request.user.pk:
             messages.error(request, 'You cannot delete your own account.')
             return redirect('users:user_list')
         
-        user.delete()
+        users = User.objects.filter(pk=self.kwargs['pk'])
+        username = users.values_list('display_name', flat=True).first()
+        if username is None:
+            raise Http404('No user found matching the query')
+        
+        users.delete()
         messages.success(request, f'User {username} deleted successfully!')
         return redirect('users:user_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:user_list')
+        return _USER_LIST_URL
 
 
 class ProfileView(LoginRequiredMixin, TemplateView):
@@ -262,7 +258,7 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         return redirect('users:profile')
 
     def get_success_url(self):
-        return reverse_lazy('users:profile')
+        return _PROFILE_URL
 
 
 class ProfilePasswordChangeView(LoginRequiredMixin, FormView):
@@ -283,11 +279,20 @@ class ProfilePasswordChangeView(LoginRequiredMixin, FormView):
         return redirect('users:profile')
 
     def get_success_url(self):
-        return reverse_lazy('users:profile')
+        return _PROFILE_URL
 
 
 # Trainer-Trainee Assignment Views
 
+def _add_duplicate_assignment_error(form):
+    """Flag an assignment form whose save hit the unique trainer/trainee constraint."""
+    trainer = form.cleaned_data['trainer']
+    form.add_error(
+        None,
+        f"This trainee is already assigned to {trainer.display_name}."
+    )
+
+
 class AssignmentListView(StaffOrAboveRequiredMixin, ListView):
     """List view for trainer-trainee assignments."""
     model = TrainerTraineeAssignment
@@ -334,23 +339,23 @@ class AssignmentCreateView(StaffOrAboveRequiredMixin, CreateView):
     template_name = "users/assignment_form.html"
     login_url = "users:login"
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs['user'] = self.request.user
-        return kwargs
-
     def form_valid(self, form):
         assignment = form.save(commit=False)
         assignment.assigned_by = self.request.user
-        assignment.save()
+        try:
+            with transaction.atomic():
+                assignment.save()
+        except IntegrityError:
+            _add_duplicate_assignment_error(form)
+            return self.form_invalid(form)
         messages.success(
             self.request,
-            f'Successfully assigned {assignment.trainee.get_full_name() or assignment.trainee.username} to {assignment.trainer.get_full_name() or assignment.trainer.username}!'
+            f'Successfully assigned {assignment.trainee.display_name} to {assignment.trainer.display_name}!'
         )
         return redirect('users:assignment_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:assignment_list')
+        return _ASSIGNMENT_LIST_URL
 
 
 class AssignmentUpdateView(StaffOrAboveRequiredMixin, UpdateView):
@@ -360,13 +365,13 @@ class AssignmentUpdateView(StaffOrAboveRequiredMixin, UpdateView):
     template_name = "users/assignment_form.html"
     login_url = "users:login"
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs['user'] = self.request.user
-        return kwargs
-
     def form_valid(self, form):
-        assignment = form.save()
+        try:
+            with transaction.atomic():
+                assignment = form.save()
+        except IntegrityError:
+            _add_duplicate_assignment_error(form)
+            return self.form_invalid(form)
         messages.success(
             self.request,
             f'Assignment updated successfully!'
@@ -374,7 +379,7 @@ class AssignmentUpdateView(StaffOrAboveRequiredMixin, UpdateView):
         return redirect('users:assignment_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:assignment_list')
+        return _ASSIGNMENT_LIST_URL
 
 
 class AssignmentDeleteView(StaffOrAboveRequiredMixin, DeleteView):
@@ -390,28 +395,38 @@ class AssignmentDeleteView(StaffOrAboveRequiredMixin, DeleteView):
         return redirect('users:assignment_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:assignment_list')
+        return _ASSIGNMENT_LIST_URL
+
+
+# User columns rendered on the trainer/trainee contact cards
+_USER_CARD_FIELDS = ('username', 'first_name', 'last_name', 'email', 'phone_number', 'profile_picture')
 
 
-class TrainerTraineesView(LoginRequiredMixin, TemplateView):
-    """View for trainers to see their assigned trainees."""
+class TrainerTraineesView(LoginRequiredMixin, ListView):
+    """View for trainers to see their assigned trainees with pagination."""
     template_name = "users/trainer_trainees.html"
+    context_object_name = "assignments"
+    paginate_by = 20
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_trainer():
+        if not request.user.is_trainer:
             messages.error(request, 'You must be a trainer to access this page.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        assignments = TrainerTraineeAssignment.objects.filter(
+    def get_queryset(self):
+        return TrainerTraineeAssignment.objects.filter(
             trainer=self.request.user,
             is_active=True
-        ).select_related('trainee').order_by('-assigned_at')
-        context['assignments'] = assignments
-        context['trainees'] = [assignment.trainee for assignment in assignments]
+        ).select_related(None).select_related('trainee').only(
+            *(f'trainee__{field}' for field in _USER_CARD_FIELDS)
+        ).order_by('-assigned_at')
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Trainees on the current page only
+        context['trainees'] = [assignment.trainee for assignment in context['assignments']]
         return context
 
 
@@ -421,7 +436,7 @@ class TraineeTrainerView(LoginRequiredMixin, TemplateView):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_trainee():
+        if not request.user.is_trainee:
             messages.error(request, 'You must be a trainee to access this page.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -431,7 +446,9 @@ class TraineeTrainerView(LoginRequiredMixin, TemplateView):
         assignment = TrainerTraineeAssignment.objects.filter(
             trainee=self.request.user,
             is_active=True
-        ).select_related('trainer', 'assigned_by').first()
+        ).select_related(None).select_related('trainer').only(
+            'assigned_at', 'notes', *(f'trainer__{field}' for field in _USER_CARD_FIELDS)
+        ).first()
         context['assignment'] = assignment
         context['trainer'] = assignment.trainer if assignment else None
         return context
@@ -439,12 +456,21 @@ class TraineeTrainerView(LoginRequiredMixin, TemplateView):
 
 # Attendance Views
 
+def _append_attendance_notes(attendance, notes):
+    """Append notes to an attendance; return False, leaving it unchanged, if they don't fit."""
+    combined = f'{attendance.notes}\n{notes}' if attendance.notes else notes
+    if len(combined) > _ATTENDANCE_NOTES_MAX_LENGTH:
+        return False
+    attendance.notes = combined
+    return True
+
+
 class CheckInView(LoginRequiredMixin, View):
     """View for trainees to check in."""
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_trainee():
+        if not request.user.is_trainee:
             messages.error(request, 'Only trainees can check in.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -461,11 +487,17 @@ class CheckInView(LoginRequiredMixin, View):
             return redirect('users:attendance_check_in')
 
         # Create new attendance record
-        attendance = Attendance.objects.create(
-            trainee=request.user,
-            check_in=timezone.now(),
-            marked_by=None  # Self check-in
-        )
+        try:
+            with transaction.atomic():
+                attendance = Attendance.objects.create(
+                    trainee=request.user,
+                    check_in=timezone.now(),
+                    marked_by=None  # Self check-in
+                )
+        except IntegrityError:
+            # A concurrent check-in opened an attendance first
+            messages.warning(request, 'You are already checked in. Please check out first.')
+            return redirect('users:attendance_check_in')
         messages.success(request, f'Checked in successfully at {attendance.check_in.strftime("%H:%M:%S")}')
         return redirect('users:attendance_check_in')
 
@@ -475,7 +507,7 @@ class CheckOutView(LoginRequiredMixin, View):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_trainee():
+        if not request.user.is_trainee:
             messages.error(request, 'Only trainees can check out.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -494,10 +526,9 @@ class CheckOutView(LoginRequiredMixin, View):
         # Update check-out time
         attendance.check_out = timezone.now()
         attendance.save()
+        attendance.refresh_from_db(fields=['duration_minutes'])
 
-        duration = attendance.duration
-        hours = duration // 60 if duration else 0
-        minutes = duration % 60 if duration else 0
+        hours, minutes = divmod(attendance.duration_minutes, 60)
         messages.success(
             request,
             f'Checked out successfully. Duration: {hours}h {minutes}m'
@@ -511,7 +542,7 @@ class AttendanceCheckInView(LoginRequiredMixin, TemplateView):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_trainee():
+        if not request.user.is_trainee:
             messages.error(request, 'Only trainees can access this page.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -548,10 +579,10 @@ class AttendanceHistoryView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         user = self.request.user
         
-        if user.is_trainee():
+        if user.is_trainee:
             # Trainees see their own attendance
             queryset = Attendance.objects.filter(trainee=user)
-        elif user.is_trainer():
+        elif user.is_trainer:
             # Trainers see attendance of their assigned trainees
             trainee_ids = TrainerTraineeAssignment.objects.filter(
                 trainer=user,
@@ -587,8 +618,8 @@ class AttendanceHistoryView(LoginRequiredMixin, ListView):
         context['search_query'] = self.request.GET.get('search', '')
         context['date_from'] = self.request.GET.get('date_from', '')
         context['date_to'] = self.request.GET.get('date_to', '')
-        context['is_trainer'] = self.request.user.is_trainer()
-        context['is_trainee'] = self.request.user.is_trainee()
+        context['is_trainer'] = self.request.user.is_trainer
+        context['is_trainee'] = self.request.user.is_trainee
         return context
 
 
@@ -598,7 +629,7 @@ class AttendanceStatisticsView(LoginRequiredMixin, TemplateView):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not (request.user.is_trainer() or request.user.is_staff_or_above()):
+        if not (request.user.is_trainer or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to view statistics.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -611,9 +642,9 @@ class AttendanceStatisticsView(LoginRequiredMixin, TemplateView):
         this_month_start = today.replace(day=1)
 
         # Get queryset based on user role
-        if user.is_trainee():
+        if user.is_trainee:
             attendances = Attendance.objects.filter(trainee=user)
-        elif user.is_trainer():
+        elif user.is_trainer:
             trainee_ids = TrainerTraineeAssignment.objects.filter(
                 trainer=user,
                 is_active=True
@@ -627,16 +658,10 @@ class AttendanceStatisticsView(LoginRequiredMixin, TemplateView):
         context['today_count'] = today_attendances.count()
         context['today_checked_in'] = today_attendances.filter(check_out__isnull=True).count()
 
-        # This week's statistics
-        week_attendances = attendances.filter(check_in__date__gte=this_week_start)
-        context['week_count'] = week_attendances.count()
-        # Calculate average duration for completed sessions
-        completed_week = week_attendances.exclude(check_out__isnull=True)
-        if completed_week.exists():
-            total_minutes = sum(att.duration for att in completed_week if att.duration)
-            context['week_avg_duration'] = total_minutes / completed_week.count() if completed_week.count() > 0 else 0
-        else:
-            context['week_avg_duration'] = 0
+        # This week's statistics, with the average over completed visits
+        week_stats = attendances.stats(since=this_week_start)
+        context['week_count'] = week_stats['sessions']
+        context['week_avg_duration'] = week_stats['avg_minutes'] or 0
 
         # This month's statistics
         month_attendances = attendances.filter(check_in__date__gte=this_month_start)
@@ -658,7 +683,7 @@ class AttendanceStatisticsView(LoginRequiredMixin, TemplateView):
         context['last_7_days'] = last_7_days
 
         # Top trainees (if trainer or staff)
-        if user.is_trainer() or user.is_staff_or_above():
+        if user.is_trainer or user.is_staff_or_above:
             top_trainees = attendances.values('trainee__username', 'trainee__first_name', 'trainee__last_name').annotate(
                 count=Count('id')
             ).order_by('-count')[:5]
@@ -672,7 +697,7 @@ class TrainerMarkAttendanceView(LoginRequiredMixin, View):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not (request.user.is_trainer() or request.user.is_staff_or_above()):
+        if not (request.user.is_trainer or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to mark attendance.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -681,11 +706,11 @@ class TrainerMarkAttendanceView(LoginRequiredMixin, View):
         user = request.user
         
         # Staff users can see all trainees, trainers see only assigned ones
-        if user.is_staff_or_above():
+        if user.is_staff_or_above:
             # Get all trainees based on staff level
-            if user.is_manager():
+            if user.is_manager:
                 trainees = User.objects.filter(role=User.Role.TRAINEE, is_active=True)
-            elif user.is_owner():
+            elif user.is_owner:
                 trainees = User.objects.filter(role__in=[User.Role.TRAINEE, User.Role.MANAGER], is_active=True)
             else:  # Super Admin
                 trainees = User.objects.filter(role=User.Role.TRAINEE, is_active=True)
@@ -716,7 +741,7 @@ class TrainerMarkAttendanceView(LoginRequiredMixin, View):
         context = {
             'trainee_attendance_list': trainee_attendance_list,
             'today': today,
-            'is_staff': user.is_staff_or_above(),
+            'is_staff': user.is_staff_or_above,
         }
         return render(request, 'users/trainer_mark_attendance.html', context)
 
@@ -729,10 +754,14 @@ class TrainerMarkAttendanceView(LoginRequiredMixin, View):
             messages.error(request, 'Invalid request.')
             return redirect('users:trainer_mark_attendance')
 
+        if len(notes) > _ATTENDANCE_NOTES_MAX_LENGTH:
+            messages.error(request, f'Notes cannot be longer than {_ATTENDANCE_NOTES_MAX_LENGTH} characters.')
+            return redirect('users:trainer_mark_attendance')
+
         user = request.user
         
         # Staff users can mark attendance for any trainee, trainers only for assigned ones
-        if user.is_staff_or_above():
+        if user.is_staff_or_above:
             try:
                 trainee = User.objects.get(id=trainee_id, role=User.Role.TRAINEE)
             except User.DoesNotExist:
@@ -753,24 +782,28 @@ class TrainerMarkAttendanceView(LoginRequiredMixin, View):
             trainee = assignment.trainee
 
         if action == 'check_in':
-            # Check if already checked in today
-            today = timezone.now().date()
+            # Check if already checked in (an open attendance from any day)
             existing = Attendance.objects.filter(
                 trainee=trainee,
-                check_in__date=today,
                 check_out__isnull=True
             ).first()
 
             if existing:
                 messages.warning(request, f'{trainee.get_full_name() or trainee.username} is already checked in.')
             else:
-                Attendance.objects.create(
-                    trainee=trainee,
-                    check_in=timezone.now(),
-                    marked_by=request.user,
-                    notes=notes
-                )
-                messages.success(request, f'Checked in {trainee.get_full_name() or trainee.username} successfully.')
+                try:
+                    with transaction.atomic():
+                        Attendance.objects.create(
+                            trainee=trainee,
+                            check_in=timezone.now(),
+                            marked_by=request.user,
+                            notes=notes
+                        )
+                except IntegrityError:
+                    # A concurrent check-in opened an attendance first
+                    messages.warning(request, f'{trainee.get_full_name() or trainee.username} is already checked in.')
+                else:
+                    messages.success(request, f'Checked in {trainee.get_full_name() or trainee.username} successfully.')
 
         elif action == 'check_out':
             # Find active attendance
@@ -783,8 +816,11 @@ class TrainerMarkAttendanceView(LoginRequiredMixin, View):
                 messages.warning(request, f'{trainee.get_full_name() or trainee.username} is not checked in.')
             else:
                 attendance.check_out = timezone.now()
-                if notes:
-                    attendance.notes = (attendance.notes + '\n' + notes) if attendance.notes else notes
+                if notes and not _append_attendance_notes(attendance, notes):
+                    messages.warning(
+                        request,
+                        f'Notes were not saved: the attendance notes would exceed {_ATTENDANCE_NOTES_MAX_LENGTH} characters.'
+                    )
                 attendance.save()
                 messages.success(request, f'Checked out {trainee.get_full_name() or trainee.username} successfully.')
 
@@ -798,7 +834,7 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not (request.user.is_trainer() or request.user.is_staff_or_above()):
+        if not (request.user.is_trainer or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to mark attendance.')
             return redirect('core:dashboard')
         return super().dispatch(request, *args, **kwargs)
@@ -808,7 +844,7 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
         user = self.request.user
         
         # Get available trainees based on user role
-        if user.is_staff_or_above():
+        if user.is_staff_or_above:
             trainees = User.objects.filter(role=User.Role.TRAINEE, is_active=True)
         else:
             # Get trainer's assigned trainees
@@ -845,10 +881,10 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
         user = self.request.user
         
         # Get available trainees for display
-        if user.is_staff_or_above():
-            if user.is_manager():
+        if user.is_staff_or_above:
+            if user.is_manager:
                 trainees = User.objects.filter(role=User.Role.TRAINEE, is_active=True)
-            elif user.is_owner():
+            elif user.is_owner:
                 trainees = User.objects.filter(role=User.Role.TRAINEE, is_active=True)
             else:  # Super Admin
                 trainees = User.objects.filter(role=User.Role.TRAINEE, is_active=True)
@@ -885,7 +921,7 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
         
         context['trainee_list'] = trainee_list
         context['today'] = today
-        context['is_staff'] = user.is_staff_or_above()
+        context['is_staff'] = user.is_staff_or_above
         return context
 
     def form_valid(self, form):
@@ -903,14 +939,13 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
             return self.form_invalid(form)
         
         user = self.request.user
-        today = timezone.now().date()
         success_count = 0
         warning_count = 0
         error_messages = []
         
         for trainee in trainees:
             # Verify permission for trainers
-            if not user.is_staff_or_above():
+            if not user.is_staff_or_above:
                 assignment = TrainerTraineeAssignment.objects.filter(
                     trainer=user,
                     trainee=trainee,
@@ -921,10 +956,9 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
                     continue
             
             if action == 'check_in':
-                # Check if already checked in today
+                # Check if already checked in (an open attendance from any day)
                 existing = Attendance.objects.filter(
                     trainee=trainee,
-                    check_in__date=today,
                     check_out__isnull=True
                 ).first()
                 
@@ -932,13 +966,20 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
                     warning_count += 1
                     error_messages.append(f"{trainee.get_full_name() or trainee.username} is already checked in.")
                 else:
-                    Attendance.objects.create(
-                        trainee=trainee,
-                        check_in=timezone.now(),
-                        marked_by=user,
-                        notes=notes
-                    )
-                    success_count += 1
+                    try:
+                        with transaction.atomic():
+                            Attendance.objects.create(
+                                trainee=trainee,
+                                check_in=timezone.now(),
+                                marked_by=user,
+                                notes=notes
+                            )
+                    except IntegrityError:
+                        # A concurrent check-in opened an attendance first
+                        warning_count += 1
+                        error_messages.append(f"{trainee.get_full_name() or trainee.username} is already checked in.")
+                    else:
+                        success_count += 1
             
             elif action == 'check_out':
                 # Find active attendance
@@ -952,8 +993,11 @@ class BulkAttendanceMarkView(LoginRequiredMixin, FormView):
                     error_messages.append(f"{trainee.get_full_name() or trainee.username} is not checked in.")
                 else:
                     attendance.check_out = timezone.now()
-                    if notes:
-                        attendance.notes = (attendance.notes + '\n' + notes) if attendance.notes else notes
+                    if notes and not _append_attendance_notes(attendance, notes):
+                        error_messages.append(
+                            f"Notes for {trainee.get_full_name() or trainee.username} were not saved: "
+                            f"they would exceed {_ATTENDANCE_NOTES_MAX_LENGTH} characters."
+                        )
                     attendance.save()
                     success_count += 1
         
@@ -992,10 +1036,10 @@ class TrainerAvailabilityListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         user = self.request.user
         
-        if user.is_trainer():
+        if user.is_trainer:
             # Trainers see their own availability
             queryset = TrainerAvailability.objects.filter(trainer=user)
-        elif user.is_trainee():
+        elif user.is_trainee:
             # Trainees see their assigned trainer's availability
             assignment = TrainerTraineeAssignment.objects.filter(
                 trainee=user,
@@ -1017,22 +1061,23 @@ class TrainerAvailabilityListView(LoginRequiredMixin, ListView):
         if trainer_id:
             queryset = queryset.filter(trainer_id=trainer_id)
         
-        # Filter by day of week if provided
+        # Filter by day of week if provided, as a range over minutes-of-week
         day_of_week = self.request.GET.get('day_of_week')
         if day_of_week:
-            queryset = queryset.filter(day_of_week=day_of_week)
+            day_start = int(day_of_week) * 1440
+            queryset = queryset.filter(start_mow__gte=day_start, start_mow__lt=day_start + 1440)
         
-        return queryset.select_related('trainer').order_by('trainer', 'day_of_week', 'start_time')
+        return queryset.select_related('trainer').order_by('trainer', 'start_mow')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['trainer_filter'] = self.request.GET.get('trainer', '')
         context['day_filter'] = self.request.GET.get('day_of_week', '')
-        context['is_trainer'] = self.request.user.is_trainer()
-        context['is_trainee'] = self.request.user.is_trainee()
+        context['is_trainer'] = self.request.user.is_trainer
+        context['is_trainee'] = self.request.user.is_trainee
         
         # Get available trainers for filter
-        if self.request.user.is_staff_or_above():
+        if self.request.user.is_staff_or_above:
             context['trainers'] = User.objects.filter(role=User.Role.TRAINER, is_active=True)
         
         return context
@@ -1046,7 +1091,7 @@ class TrainerAvailabilityCreateView(LoginRequiredMixin, CreateView):
     login_url = "users:login"
 
     def dispatch(self, request, *args, **kwargs):
-        if not request.user.is_trainer():
+        if not request.user.is_trainer:
             messages.error(request, 'Only trainers can manage their availability.')
             return redirect('users:trainer_availability_list')
         return super().dispatch(request, *args, **kwargs)
@@ -1064,7 +1109,7 @@ class TrainerAvailabilityCreateView(LoginRequiredMixin, CreateView):
         return redirect('users:trainer_availability_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:trainer_availability_list')
+        return _AVAILABILITY_LIST_URL
 
 
 class TrainerAvailabilityUpdateView(LoginRequiredMixin, UpdateView):
@@ -1076,7 +1121,7 @@ class TrainerAvailabilityUpdateView(LoginRequiredMixin, UpdateView):
 
     def dispatch(self, request, *args, **kwargs):
         availability = self.get_object()
-        if not request.user.is_trainer() or availability.trainer != request.user:
+        if not request.user.is_trainer or availability.trainer != request.user:
             messages.error(request, 'You can only edit your own availability.')
             return redirect('users:trainer_availability_list')
         return super().dispatch(request, *args, **kwargs)
@@ -1091,7 +1136,7 @@ class TrainerAvailabilityUpdateView(LoginRequiredMixin, UpdateView):
         return super().form_valid(form)
 
     def get_success_url(self):
-        return reverse_lazy('users:trainer_availability_list')
+        return _AVAILABILITY_LIST_URL
 
 
 class TrainerAvailabilityDeleteView(LoginRequiredMixin, DeleteView):
@@ -1102,7 +1147,7 @@ class TrainerAvailabilityDeleteView(LoginRequiredMixin, DeleteView):
 
     def dispatch(self, request, *args, **kwargs):
         availability = self.get_object()
-        if not request.user.is_trainer() or availability.trainer != request.user:
+        if not request.user.is_trainer or availability.trainer != request.user:
             messages.error(request, 'You can only delete your own availability.')
             return redirect('users:trainer_availability_list')
         return super().dispatch(request, *args, **kwargs)
@@ -1114,7 +1159,7 @@ class TrainerAvailabilityDeleteView(LoginRequiredMixin, DeleteView):
         return redirect('users:trainer_availability_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:trainer_availability_list')
+        return _AVAILABILITY_LIST_URL
 
 
 class TrainingSessionListView(LoginRequiredMixin, ListView):
@@ -1128,10 +1173,10 @@ class TrainingSessionListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         user = self.request.user
         
-        if user.is_trainee():
+        if user.is_trainee:
             # Trainees see their own sessions
             queryset = TrainingSession.objects.filter(trainee=user)
-        elif user.is_trainer():
+        elif user.is_trainer:
             # Trainers see sessions with their assigned trainees
             queryset = TrainingSession.objects.filter(trainer=user)
         else:
@@ -1158,8 +1203,8 @@ class TrainingSessionListView(LoginRequiredMixin, ListView):
         context['status_filter'] = self.request.GET.get('status', '')
         context['date_from'] = self.request.GET.get('date_from', '')
         context['date_to'] = self.request.GET.get('date_to', '')
-        context['is_trainer'] = self.request.user.is_trainer()
-        context['is_trainee'] = self.request.user.is_trainee()
+        context['is_trainer'] = self.request.user.is_trainer
+        context['is_trainee'] = self.request.user.is_trainee
         return context
 
 
@@ -1183,7 +1228,7 @@ class TrainingSessionCreateView(LoginRequiredMixin, CreateView):
         return redirect('users:training_session_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:training_session_list')
+        return _SESSION_LIST_URL
 
 
 class TrainingSessionUpdateView(LoginRequiredMixin, UpdateView):
@@ -1196,7 +1241,7 @@ class TrainingSessionUpdateView(LoginRequiredMixin, UpdateView):
     def dispatch(self, request, *args, **kwargs):
         session = self.get_object()
         # Allow trainers, trainees, and staff to update
-        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above()):
+        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to edit this session.')
             return redirect('users:training_session_list')
         return super().dispatch(request, *args, **kwargs)
@@ -1211,7 +1256,7 @@ class TrainingSessionUpdateView(LoginRequiredMixin, UpdateView):
         return super().form_valid(form)
 
     def get_success_url(self):
-        return reverse_lazy('users:training_session_list')
+        return _SESSION_LIST_URL
 
 
 class TrainingSessionDeleteView(LoginRequiredMixin, DeleteView):
@@ -1223,7 +1268,7 @@ class TrainingSessionDeleteView(LoginRequiredMixin, DeleteView):
     def dispatch(self, request, *args, **kwargs):
         session = self.get_object()
         # Allow trainers, trainees, and staff to delete
-        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above()):
+        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to delete this session.')
             return redirect('users:training_session_list')
         return super().dispatch(request, *args, **kwargs)
@@ -1235,7 +1280,7 @@ class TrainingSessionDeleteView(LoginRequiredMixin, DeleteView):
         return redirect('users:training_session_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:training_session_list')
+        return _SESSION_LIST_URL
 
 
 class TrainingSessionCancelView(LoginRequiredMixin, View):
@@ -1252,8 +1297,12 @@ class TrainingSessionCancelView(LoginRequiredMixin, View):
             messages.error(request, 'Session not found.')
             return redirect('users:training_session_list')
         
+        if len(reason) > _CANCELLATION_REASON_MAX_LENGTH:
+            messages.error(request, f'Cancellation reason cannot be longer than {_CANCELLATION_REASON_MAX_LENGTH} characters.')
+            return redirect('users:training_session_list')
+        
         # Check permissions
-        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above()):
+        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to cancel this session.')
             return redirect('users:training_session_list')
         
@@ -1282,13 +1331,13 @@ class CalendarView(LoginRequiredMixin, TemplateView):
         month = int(self.request.GET.get('month', timezone.now().month))
         
         # Get sessions for the month
-        if user.is_trainee():
+        if user.is_trainee:
             sessions = TrainingSession.objects.filter(
                 trainee=user,
                 session_date__year=year,
                 session_date__month=month
             )
-        elif user.is_trainer():
+        elif user.is_trainer:
             sessions = TrainingSession.objects.filter(
                 trainer=user,
                 session_date__year=year,
@@ -1371,11 +1420,11 @@ class SessionReminderListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         user = self.request.user
         
-        if user.is_trainee():
+        if user.is_trainee:
             # Trainees see reminders for their sessions
             session_ids = TrainingSession.objects.filter(trainee=user).values_list('id', flat=True)
             queryset = SessionReminder.objects.filter(session_id__in=session_ids)
-        elif user.is_trainer():
+        elif user.is_trainer:
             # Trainers see reminders for their sessions
             session_ids = TrainingSession.objects.filter(trainer=user).values_list('id', flat=True)
             queryset = SessionReminder.objects.filter(session_id__in=session_ids)
@@ -1387,8 +1436,8 @@ class SessionReminderListView(LoginRequiredMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['is_trainer'] = self.request.user.is_trainer()
-        context['is_trainee'] = self.request.user.is_trainee()
+        context['is_trainer'] = self.request.user.is_trainer
+        context['is_trainee'] = self.request.user.is_trainee
         return context
 
 
@@ -1412,7 +1461,7 @@ class SessionReminderCreateView(LoginRequiredMixin, CreateView):
             return redirect('users:training_session_list')
         
         # Check permissions
-        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above()):
+        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to create reminders for this session.')
             return redirect('users:training_session_list')
         
@@ -1434,7 +1483,7 @@ class SessionReminderCreateView(LoginRequiredMixin, CreateView):
         return redirect('users:session_reminder_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:session_reminder_list')
+        return _REMINDER_LIST_URL
 
 
 class SessionReminderDeleteView(LoginRequiredMixin, DeleteView):
@@ -1447,7 +1496,7 @@ class SessionReminderDeleteView(LoginRequiredMixin, DeleteView):
         reminder = self.get_object()
         session = reminder.session
         # Check permissions
-        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above()):
+        if not (request.user == session.trainer or request.user == session.trainee or request.user.is_staff_or_above):
             messages.error(request, 'You do not have permission to delete this reminder.')
             return redirect('users:session_reminder_list')
         return super().dispatch(request, *args, **kwargs)
@@ -1459,4 +1508,4 @@ class SessionReminderDeleteView(LoginRequiredMixin, DeleteView):
         return redirect('users:session_reminder_list')
 
     def get_success_url(self):
-        return reverse_lazy('users:session_reminder_list')
+        return _REMINDER_LIST_URL